@@ -1,8 +1,71 @@
 import streamlit as st
+import pandas as pd
 import zipfile
 import io
+import copy
 import re
 import os
+import mmap
+import struct
+import shutil
+import logging
+import time
+import tempfile
+import tracemalloc
+import html
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Level of the app's own log lines (memory accounting, budget decisions, skipped embeddings).
+# Streamlit only configures its streamlit.* loggers, so main() attaches a handler for these.
+LOG_LEVEL = os.environ.get("WORDCONSOLIDATION_LOG_LEVEL", "INFO").upper()
+
+# Optional tracemalloc-based memory accounting (off by default, it slows processing down)
+MEMORY_ACCOUNTING = os.environ.get("WORDCONSOLIDATION_MEMORY_ACCOUNTING", "0") == "1"
+
+# Hard wall-clock limit for one document operation, in seconds. 0 disables.
+OPERATION_TIMEOUT_S = float(os.environ.get("WORDCONSOLIDATION_OPERATION_TIMEOUT_S", "0"))
+
+# Per-request memory budget in MB. 0 disables the budget check.
+MEMORY_BUDGET_MB = int(os.environ.get("WORDCONSOLIDATION_MEMORY_BUDGET_MB", "0"))
+
+# Uploads whose parts inflate beyond this are rejected by the probe (zip bomb guard)
+MAX_UNCOMPRESSED_MB = int(os.environ.get("WORDCONSOLIDATION_MAX_UNCOMPRESSED_MB", "2048"))
+
+# Rough XML scan throughput (MB/s of uncompressed XML) used for the processing time estimate
+PROCESSING_THROUGHPUT_MB_S = 40
+
+# Members every .docx package must contain, plus at least one XML part under word/.
+# The main part is not always word/document.xml (some Office Online saves write
+# word/document2.xml), so it is not required by name.
+REQUIRED_DOCX_PARTS = ("[Content_Types].xml",)
+WORD_XML_PART = re.compile(r'^word/[^/]+\.xml$')
+
+# Embedded Office packages sanitized recursively by process_docx
+EMBEDDED_PACKAGE = re.compile(r'^(?:word|xl|ppt)/embeddings/[^/]+\.(?:docx|docm|xlsx|xlsm|pptx|pptm)$', re.IGNORECASE)
+
+# Worker threads, nesting depth and per-package size limit for embedded packages
+EMBEDDING_WORKERS = int(os.environ.get("WORDCONSOLIDATION_EMBEDDING_WORKERS", "4"))
+EMBEDDING_MAX_DEPTH = int(os.environ.get("WORDCONSOLIDATION_EMBEDDING_MAX_DEPTH", "3"))
+EMBEDDING_MAX_MB = int(os.environ.get("WORDCONSOLIDATION_EMBEDDING_MAX_MB", "64"))
+
+# Page sizes offered by the author selection table
+AUTHOR_PAGE_SIZES = [25, 50, 100, 250]
+
+# Uploads at least this large are spooled once to a temp file and read through mmap. 0 disables.
+# Off by default so that uploads never touch the disk unless the operator opts in.
+MMAP_THRESHOLD_MB = int(os.environ.get("WORDCONSOLIDATION_MMAP_THRESHOLD_MB", "0"))
+
+# Whether large uploads or outputs may be spooled to (already unlinked) temp files
+DISK_SPOOLING = MMAP_THRESHOLD_MB > 0 or MEMORY_BUDGET_MB > 0
+
+# Zip local file header: signature, versions/flags/method/time/date, crc/sizes, name and extra lengths
+ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+# Chunk size used when copying non-XML members on the streaming path
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 # Word standard highlight colors with their hex values for UI preview
 HIGHLIGHT_COLORS = {
@@ -22,6 +85,551 @@ HIGHLIGHT_COLORS = {
     "darkGray": "#808080",
 }
 
+class OperationCancelled(Exception):
+    """Raised at a cancellation checkpoint once an operation has been cancelled."""
+
+class OperationTimedOut(OperationCancelled):
+    """Raised at a cancellation checkpoint once an operation has run past its deadline."""
+
+class CancelToken:
+    """
+    Cooperative cancellation for one document operation.
+
+    Processing functions call check() between parts and inside long per-part loops. It raises
+    once the token is cancelled or past its deadline, and otherwise calls on_check(progress)
+    at most every check_interval seconds (unless report=False, as in worker threads). The UI uses on_check to update a progress bar; that
+    element update is also where Streamlit stops a run made stale by a new upload or a closed tab.
+
+    Part loops call enter_part(); checks inside the part then pass the fraction of the part done,
+    which is mapped onto the part's share of the overall progress.
+    """
+
+    def __init__(self, timeout=None, on_check=None, check_interval=0.1):
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.timeout = timeout
+        self.on_check = on_check
+        self.check_interval = check_interval
+        self.reason = None
+        self.part_span = (0.0, 1.0)
+        self._last_hook = 0.0
+
+    @property
+    def cancelled(self):
+        return self.reason is not None
+
+    def cancel(self, reason="cancelled"):
+        if self.reason is None:
+            self.reason = reason
+
+    def enter_part(self, index, count):
+        """Starts part index of count and checks at its start."""
+        self.part_span = (index / count, (index + 1) / count)
+        self.check(self.part_span[0])
+
+    def check(self, progress=None, report=True, fraction=None):
+        if fraction is not None:
+            start, end = self.part_span
+            progress = start + (end - start) * min(max(fraction, 0.0), 1.0)
+        if self.reason is not None:
+            raise OperationCancelled(self.reason)
+        now = time.monotonic()
+        if self.deadline is not None and now > self.deadline:
+            self.reason = f"timed out after {self.timeout:g} s"
+            raise OperationTimedOut(self.reason)
+        if report and self.on_check is not None and now - self._last_hook >= self.check_interval:
+            self._last_hook = now
+            self.on_check(progress)
+
+def _checkpoint(cancel_token, progress=None, report=True, fraction=None):
+    """
+    Cancellation checkpoint; no-op without a token. Worker threads pass report=False.
+    Checks inside a part pass fraction, the share of the current part done so far.
+    """
+    if cancel_token is not None:
+        cancel_token.check(progress, report, fraction)
+
+def _enter_part(cancel_token, index, count):
+    """Checkpoint at the start of part index of count; no-op without a token."""
+    if cancel_token is not None:
+        cancel_token.enter_part(index, count)
+
+def start_job(state_key, label):
+    """
+    Creates the CancelToken for a UI operation, with a progress bar and the admin timeout.
+    Any job still registered under state_key is cancelled first.
+    """
+    cancel_job(state_key, "superseded by a new operation")
+    progress_bar = st.progress(0.0, text=label)
+    last_progress = [0.0]
+
+    def on_check(progress):
+        # Always touch the element, even without new progress: that is where a stale run is stopped
+        if progress is not None:
+            last_progress[0] = min(max(progress, 0.0), 1.0)
+        progress_bar.progress(last_progress[0], text=label)
+
+    token = CancelToken(timeout=OPERATION_TIMEOUT_S or None, on_check=on_check)
+    token.progress_bar = progress_bar
+    st.session_state[state_key] = token
+    return token
+
+def finish_job(state_key, token):
+    """Unregisters the token and removes the progress bar."""
+    # Unregister first: removing the bar is an element update, where a stopped run raises
+    if st.session_state.get(state_key) is token:
+        st.session_state.pop(state_key, None)
+    token.progress_bar.empty()
+
+def cancel_job(state_key, reason="cancelled"):
+    """Cancels the job registered under state_key, if any (e.g. when its upload changes)."""
+    token = st.session_state.pop(state_key, None)
+    if token is not None:
+        token.cancel(reason)
+
+@contextmanager
+def track_memory(operation):
+    """
+    Records the peak traced allocation of an operation and of each part it touches.
+    Yields a stats dict (or None if accounting is disabled) that can be passed to
+    the processing functions as `memory_stats`.
+
+    Note: tracemalloc is process-wide, so concurrent sessions inflate each other's numbers.
+    """
+    if not MEMORY_ACCOUNTING:
+        yield None
+        return
+
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    stats = {"operation": operation, "peak_bytes": 0, "parts": {}, "_baseline": baseline}
+    try:
+        yield stats
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        stats["peak_bytes"] = max(stats["peak_bytes"], peak - baseline)
+        stats.pop("_baseline", None)
+        if started_here:
+            tracemalloc.stop()
+        logger.info(
+            "memory: %s peak=%.2f MB parts=%d",
+            operation, stats["peak_bytes"] / (1024 * 1024), len(stats["parts"])
+        )
+
+def record_part_memory(memory_stats, part_name):
+    """
+    Records the peak allocation since the previous part and resets the peak counter.
+    No-op if memory_stats is None (accounting disabled).
+    """
+    if memory_stats is None or not tracemalloc.is_tracing():
+        return
+    _, peak = tracemalloc.get_traced_memory()
+    part_peak = peak - memory_stats.get("_baseline", 0)
+    memory_stats["parts"][part_name] = part_peak
+    memory_stats["peak_bytes"] = max(memory_stats["peak_bytes"], part_peak)
+    tracemalloc.reset_peak()
+
+def estimate_peak_memory(uploaded_file, copies_per_part=2):
+    """
+    Estimates peak memory (bytes) of an in-memory rewrite from the zip central directory.
+
+    Returns a tuple (in_memory_estimate, streaming_estimate):
+    - in_memory: the upload, every part's uncompressed content, the output buffer
+      (about the upload size) and its getvalue() copy, plus working copies of the largest part.
+    - streaming: the upload plus working copies of the largest XML part only, since
+      non-XML members are copied in chunks and the output is spooled to disk; the spooled
+      output (about the upload size) is read back into session state for the download.
+    Both add the embedded packages that can be in flight at once (the largest ones, input
+    and sanitized output each), see _embedding_window.
+    """
+    uploaded_file.seek(0, 2)
+    upload_size = uploaded_file.tell()
+    uploaded_file.seek(0)
+
+    with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        infos = zin.infolist()
+    uploaded_file.seek(0)
+
+    xml_sizes = [i.file_size for i in infos if i.filename.endswith('.xml')]
+    largest_part = max((i.file_size for i in infos), default=0)
+    largest_xml = max(xml_sizes, default=0)
+
+    # Packages over the size limit are copied without being read
+    embedding_sizes = sorted(
+        (i.file_size for i in infos
+         if _is_embedded_package(i.filename) and i.file_size <= EMBEDDING_MAX_MB * 1024 * 1024),
+        reverse=True,
+    )
+
+    in_memory = upload_size * 3 + largest_part * copies_per_part
+    in_memory += sum(embedding_sizes[:_embedding_window(False)]) * 2
+    streaming = upload_size * 2 + largest_xml * copies_per_part
+    streaming += sum(embedding_sizes[:_embedding_window(True)]) * 2
+    return in_memory, streaming
+
+def check_memory_budget(uploaded_file, budget_mb=None):
+    """
+    Decides how a request should run under the memory budget.
+    Returns "memory", "stream" (downgrade to the streaming path) or "reject".
+    """
+    budget_mb = MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+    if budget_mb <= 0:
+        return "memory"
+
+    budget = budget_mb * 1024 * 1024
+    try:
+        in_memory, streaming = estimate_peak_memory(uploaded_file)
+    except zipfile.BadZipFile:
+        # Let the processing functions report the bad file
+        return "memory"
+
+    if in_memory <= budget:
+        return "memory"
+    if streaming <= budget:
+        logger.info("memory: estimate %d > budget %d, downgrading to streaming path", in_memory, budget)
+        return "stream"
+    logger.warning("memory: streaming estimate %d > budget %d, rejecting upload", streaming, budget)
+    return "reject"
+
+def _open_output(streaming):
+    """Returns the output buffer: in-memory, or a temp file on the streaming path."""
+    if streaming:
+        return tempfile.TemporaryFile()
+    return io.BytesIO()
+
+def _copy_member(zin, zout, item):
+    """Copies a member in chunks without holding its full content in memory."""
+    with zin.open(item) as src, zout.open(item, 'w') as dst:
+        shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+def _copy_raw_member(zin, zout, item):
+    """
+    Copies a member's compressed bytes as they are (no inflate/deflate), in chunks.
+    zipfile has no public API for this, so it writes the local header and updates the
+    archive's bookkeeping the way ZipFile.open(mode='w') does. Encrypted members and
+    unseekable outputs fall back to a regular copy.
+    """
+    if item.flag_bits & 0x1 or not zout._seekable:
+        _copy_member(zin, zout, item)
+        return
+
+    info = copy.copy(item)
+    # Sizes and CRC go in the local header; the source's data descriptor is not copied
+    info.flag_bits &= ~0x08
+    info.extra = zipfile._strip_extra(info.extra, (1,))  # FileHeader adds its own zip64 field
+    zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+
+    with zin._lock, zout._lock:
+        source = zin.fp
+        source.seek(item.header_offset)
+        header = ZIP_LOCAL_HEADER.unpack(source.read(ZIP_LOCAL_HEADER.size))
+        if header[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {item.filename}")
+        source.seek(header[9] + header[10], os.SEEK_CUR)
+
+        if zip64 and not zout._allowZip64:
+            raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+        if zout._writing:
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it.")
+        zout.fp.seek(zout.start_dir)
+        info.header_offset = zout.fp.tell()
+        zout._writecheck(info)
+        zout._didModify = True
+        zout.fp.write(info.FileHeader(zip64))
+
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.read(min(remaining, STREAM_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {item.filename}")
+            zout.fp.write(chunk)
+            remaining -= len(chunk)
+
+        zout.start_dir = zout.fp.tell()
+        zout.filelist.append(info)
+        zout.NameToInfo[info.filename] = info
+
+def _finish_output(output_buffer, streaming):
+    """Returns bytes (in-memory path) or the rewound temp file (streaming path)."""
+    if streaming:
+        output_buffer.seek(0)
+        return output_buffer
+    return output_buffer.getvalue()
+
+def filter_authors(authors, query):
+    """
+    Returns the authors containing query (case-insensitive, surrounding whitespace ignored).
+    An empty query matches everything.
+    """
+    query = (query or "").strip().casefold()
+    if not query:
+        return list(authors)
+    return [a for a in authors if query in a.casefold()]
+
+def paginate(items, page, page_size):
+    """Returns the 1-based page of items (clamped to the last page)."""
+    page_count = max(1, -(-len(items) // page_size))
+    page = min(max(1, int(page)), page_count)
+    return items[(page - 1) * page_size:page * page_size]
+
+def _as_download_data(data):
+    """Reads a spooled streaming result into bytes for st.download_button (single copy)."""
+    if hasattr(data, "read"):
+        with data:
+            return data.read()
+    return data
+
+def probe_docx(uploaded_file, top_n=5):
+    """
+    Validates the package and summarises it from the zip central directory only;
+    no member is decompressed.
+
+    Returns a dict with "valid", "error" (message or None), "member_count",
+    "total_uncompressed", "largest_parts" [(name, size)] and "estimated_seconds".
+    """
+    probe = {
+        "valid": False, "error": None, "member_count": 0,
+        "total_uncompressed": 0, "largest_parts": [], "estimated_seconds": 0.0,
+    }
+    try:
+        uploaded_file.seek(0)
+        with zipfile.ZipFile(uploaded_file, 'r') as zin:
+            infos = zin.infolist()
+    except (zipfile.BadZipFile, OSError, ValueError):
+        probe["error"] = "The uploaded file is not a valid docx or zip file."
+        return probe
+    finally:
+        uploaded_file.seek(0)
+
+    names = {i.filename for i in infos}
+    total = sum(i.file_size for i in infos)
+    xml_total = sum(i.file_size for i in infos if i.filename.endswith('.xml'))
+    probe["member_count"] = len(infos)
+    probe["total_uncompressed"] = total
+    probe["largest_parts"] = [(i.filename, i.file_size) for i in sorted(infos, key=lambda i: i.file_size, reverse=True)[:top_n]]
+    probe["estimated_seconds"] = xml_total / (PROCESSING_THROUGHPUT_MB_S * 1024 * 1024)
+
+    missing = [name for name in REQUIRED_DOCX_PARTS if name not in names]
+    if not any(WORD_XML_PART.match(name) for name in names):
+        missing.append("word/*.xml")
+    if missing:
+        probe["error"] = f"Not a Word document: missing {', '.join(missing)}."
+    elif any(i.flag_bits & 0x1 for i in infos):
+        probe["error"] = "The document is encrypted or password-protected."
+    elif any(i.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) for i in infos):
+        probe["error"] = "The document uses an unsupported compression method."
+    elif total > MAX_UNCOMPRESSED_MB * 1024 * 1024:
+        probe["error"] = f"The document expands to {total / (1024 * 1024):.0f} MB, above the {MAX_UNCOMPRESSED_MB} MB limit."
+    else:
+        probe["valid"] = True
+    return probe
+
+def render_file_details(uploaded_file, probe):
+    """Shows the file details table, including what the probe learned from the central directory."""
+    file_details = {
+        "FileName": uploaded_file.name,
+        "FileType": uploaded_file.type,
+        "FileSize": f"{uploaded_file.size / 1024:.2f} KB",
+    }
+    if probe["member_count"]:
+        file_details["Members"] = probe["member_count"]
+        file_details["UncompressedSize"] = f"{probe['total_uncompressed'] / 1024:.2f} KB"
+        file_details["LargestParts"] = {name: f"{size / 1024:.2f} KB" for name, size in probe["largest_parts"]}
+        file_details["EstimatedProcessingTime"] = f"{probe['estimated_seconds']:.2f} s"
+    st.write(file_details)
+
+class MappedFile:
+    """
+    Minimal read-only file object over an mmap, usable by zipfile.ZipFile.
+    (mmap itself has no seekable() before Python 3.13.)
+    """
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def read(self, n=-1):
+        return self.mapping.read(n)
+
+    def seek(self, offset, whence=0):
+        self.mapping.seek(offset, whence)
+        return self.mapping.tell()
+
+    def tell(self):
+        return self.mapping.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self.mapping.close()
+
+def map_path(path):
+    """Returns a MappedFile over a file on disk (None for an empty file, which can't be mapped)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # The mapping stays valid after the file is closed
+        return MappedFile(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+def spool_to_mmap(uploaded_file):
+    """
+    Copies an in-memory upload once to an anonymous temp file and returns a MappedFile over it.
+    The temp file is already unlinked; it disappears when the mapping is closed.
+    """
+    with tempfile.TemporaryFile() as spool:
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, spool, STREAM_CHUNK_SIZE)
+        uploaded_file.seek(0)
+        spool.flush()
+        return MappedFile(mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ))
+
+def input_source(uploaded_file, state_key):
+    """
+    Returns what the readers should open: the upload itself when small, otherwise an mmap
+    spooled once per upload and cached in session state under state_key.
+    """
+    if MMAP_THRESHOLD_MB <= 0 or uploaded_file.size < MMAP_THRESHOLD_MB * 1024 * 1024:
+        return uploaded_file
+
+    cached = st.session_state.get(state_key)
+    if cached and cached[0] == uploaded_file.file_id:
+        return cached[1]
+    release_input_source(state_key)
+
+    mapping = spool_to_mmap(uploaded_file)
+    st.session_state[state_key] = (uploaded_file.file_id, mapping)
+    logger.info("mmap: spooled %s (%d bytes) for %s", uploaded_file.name, uploaded_file.size, state_key)
+    return mapping
+
+def release_input_source(state_key):
+    """Closes and forgets a cached mapping."""
+    cached = st.session_state.pop(state_key, None)
+    if cached:
+        try:
+            cached[1].close()
+        except BufferError:
+            # A reader still holds a view; the mapping is freed once it is released
+            pass
+
+def read_member(zin, item, source):
+    """
+    Returns a member's content for read-only scanning. Stored (uncompressed) members of an
+    mmap-backed package are returned as a memoryview straight into the mapping, without copying;
+    everything else is inflated with zin.read().
+    """
+    if isinstance(source, MappedFile) and item.compress_type == zipfile.ZIP_STORED:
+        header = ZIP_LOCAL_HEADER.unpack_from(source.mapping, item.header_offset)
+        if header[0] == zipfile.stringFileHeader:
+            start = item.header_offset + ZIP_LOCAL_HEADER.size + header[9] + header[10]
+            return memoryview(source.mapping)[start:start + item.file_size]
+    return zin.read(item.filename)
+
+# Authorship detection shared by the extractors, the revision browser and scan_authorship:
+# w:ins/w:del opening tags with their author, and the core properties' creator elements
+REVISION_TAG = re.compile(rb'<w:(ins|del)[^>]*w:author="([^"]*)"[^>]*>')
+CREATOR_ELEMENT = re.compile(rb'(<dc:creator>)(.*?)(</dc:creator>)')
+LAST_MODIFIED_BY_ELEMENT = re.compile(rb'(<cp:lastModifiedBy>)(.*?)(</cp:lastModifiedBy>)')
+
+# Revision browser: text runs inside a revision block, and the block's closing tag
+REVISION_TEXT = re.compile(rb'<w:(?:t|delText)(?:\s[^>]*)?>([^<]*)</w:(?:t|delText)>')
+REVISION_DATE = re.compile(rb'w:date="([^"]*)"')
+REVISION_CLOSE = {b'ins': re.compile(rb'</w:ins>'), b'del': re.compile(rb'</w:del>')}
+REVISION_KIND_LABELS = {b'ins': "Insertion", b'del': "Deletion"}
+
+# Longest revision text shown in the browser
+REVISION_TEXT_PREVIEW = 200
+
+def _scan_revisions(zin, item, offset, authors, kinds, chunk_size):
+    """
+    Streams one part from a decompressed offset and yields (offset, match, body) for each
+    w:ins/w:del opening tag that passes the filters. body is the block's content up to its
+    closing tag (empty for self-closing markers). match is only valid until the next item.
+
+    The part is inflated in chunks. Between chunks only the unscanned tail is kept, from the
+    last '<' (a tag cut by the chunk boundary holds no other '<'), or from the last match
+    while its closing tag has not been read yet.
+    """
+    with zin.open(item) as stream:
+        stream.seek(offset)
+        buffer = b''
+        base = offset  # decompressed offset of buffer[0]
+        pos = 0
+        eof = False
+        while True:
+            match = REVISION_TAG.search(buffer, pos)
+            if match is not None and ((kinds and match.group(1) not in kinds)
+                                      or (authors and match.group(2).decode('utf-8').strip() not in authors)):
+                pos = match.end()
+                continue
+
+            keep = None
+            if match is None:
+                keep = buffer.rfind(b'<', pos)
+                keep = len(buffer) if keep < 0 else keep
+            elif match.group(0).endswith(b'/>'):
+                body = b''
+            else:
+                close = REVISION_CLOSE[match.group(1)].search(buffer, match.end())
+                if close is None and not eof:
+                    keep = match.start()
+                else:
+                    body = buffer[match.end():close.start() if close else match.end()]
+
+            if keep is None:
+                yield base + match.start(), match, body
+                pos = match.end()
+                continue
+            if eof:
+                return
+
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[keep:] + chunk
+            base += keep
+            pos = 0
+
+def fetch_revisions(uploaded_file, cursor=None, limit=50, authors=None, kinds=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Returns one page of tracked changes and the cursor of the next page (None at the end).
+
+    Revisions are found with REVISION_TAG, as in extract_revision_authors. Parts are streamed
+    in chunks from the cursor (XML part index, decompressed offset) and reading stops as soon
+    as the page is full, so a page near the start of a large part never inflates the rest of it.
+    Only revisions on the page have their date and text decoded.
+    authors and kinds ("ins"/"del") filter the results; None means no filter.
+    """
+    part_index, offset = cursor or (0, 0)
+    authors = {a.strip() for a in authors} if authors else None
+    kinds = {k.encode('ascii') for k in kinds} if kinds else None
+    rows = []
+
+    with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        parts = [i for i in zin.infolist() if i.filename.endswith('.xml') and i.filename != 'word/people.xml']
+        for index in range(part_index, len(parts)):
+            item = parts[index]
+            start = offset if index == part_index else 0
+
+            for match_offset, match, body in _scan_revisions(zin, item, start, authors, kinds, chunk_size):
+                if len(rows) == limit:
+                    return rows, (index, match_offset)
+
+                # Decode only what is shown
+                kind = match.group(1)
+                text = "".join(html.unescape(m.group(1).decode('utf-8')) for m in REVISION_TEXT.finditer(body))
+                date = REVISION_DATE.search(match.group(0))
+                rows.append({
+                    "Part": item.filename,
+                    "Type": REVISION_KIND_LABELS[kind],
+                    "Author": match.group(2).decode('utf-8').strip(),
+                    "Date": date.group(1).decode('utf-8') if date else "",
+                    "Text": text if len(text) <= REVISION_TEXT_PREVIEW else text[:REVISION_TEXT_PREVIEW] + "…",
+                })
+
+    return rows, None
+
 def extract_revision_authors(uploaded_file):
     """
     Extracts unique authors from tracked changes (w:ins and w:del elements).
@@ -29,16 +637,13 @@ def extract_revision_authors(uploaded_file):
     """
     authors = set()
     
-    # Pattern to find w:ins or w:del elements with w:author attribute
-    # Matches: <w:ins ... w:author="Name" ...> or <w:del ... w:author="Name" ...>
-    pattern_ins_del = re.compile(rb'<w:(ins|del)[^>]*w:author="([^"]*)"[^>]*>')
-    
     try:
         with zipfile.ZipFile(uploaded_file, 'r') as zin:
             for item in zin.infolist():
                 if item.filename.endswith('.xml'):
-                    content = zin.read(item.filename)
-                    for match in pattern_ins_del.finditer(content):
+                    content = read_member(zin, item, uploaded_file)
+                    # w:ins or w:del elements with a w:author attribute (REVISION_TAG)
+                    for match in REVISION_TAG.finditer(content):
                         authors.add(match.group(2).decode('utf-8').strip())
     except Exception:
         pass
@@ -57,15 +662,13 @@ def extract_authors(uploaded_file):
     pattern_attr_single = re.compile(rb"((?:w|w15):author=')([^']*)(')")
     
     # 2. Element-text based: <dc:creator>Value</dc:creator> or <cp:lastModifiedBy>Value</cp:lastModifiedBy>
-    # Note: These are in docProps/core.xml usually.
-    pattern_el_creator = re.compile(rb'(<dc:creator>)(.*?)(</dc:creator>)')
-    pattern_el_lastmod = re.compile(rb'(<cp:lastModifiedBy>)(.*?)(</cp:lastModifiedBy>)')
+    # Note: These are in docProps/core.xml usually (CREATOR_ELEMENT / LAST_MODIFIED_BY_ELEMENT).
 
     try:
         with zipfile.ZipFile(uploaded_file, 'r') as zin:
             for item in zin.infolist():
                 if item.filename.endswith('.xml'):
-                    content = zin.read(item.filename)
+                    content = read_member(zin, item, uploaded_file)
                     
                     # Attribute scan
                     for match in pattern_attr_double.finditer(content):
@@ -74,9 +677,9 @@ def extract_authors(uploaded_file):
                         authors.add(match.group(2).decode('utf-8').strip())
                     
                     # Element scan
-                    for match in pattern_el_creator.finditer(content):
+                    for match in CREATOR_ELEMENT.finditer(content):
                          authors.add(match.group(2).decode('utf-8').strip())
-                    for match in pattern_el_lastmod.finditer(content):
+                    for match in LAST_MODIFIED_BY_ELEMENT.finditer(content):
                          authors.add(match.group(2).decode('utf-8').strip())
                          
     except Exception:
@@ -84,108 +687,314 @@ def extract_authors(uploaded_file):
         
     return sorted(list(authors))
 
-def process_docx(uploaded_file, target_authors, new_author_name, new_initials, remove_highlights=False):
+def scan_authorship(uploaded_file):
     """
-    Reads a docx file (as a zip), modifies XML content in memory to replace author names and initials,
-    and returns a bytes object of the new docx file.
+    Counts tracked changes (w:ins/w:del) and comments per author and reads the
+    dc:creator / cp:lastModifiedBy values, for reporting.
+    Unlike the extractors above, errors are raised rather than swallowed.
     """
-    # Create a buffer for the new docx
-    output_buffer = io.BytesIO()
-    
-    # regex patterns for replacing author and initials
-    # We look for w:author="Value" and w:initials="Value"
+    revisions = {}  # author -> {"insertions": n, "deletions": n}
+    comments = {}  # author -> n
+    creators = set()
+    last_modified_by = set()
+
+    pattern_comment = re.compile(rb'<w:comment\s[^>]*?w:author=(["\'])(.*?)\1')
+
+    with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        for item in zin.infolist():
+            if item.filename.endswith('.xml'):
+                content = read_member(zin, item, uploaded_file)
+
+                for match in REVISION_TAG.finditer(content):
+                    author = match.group(2).decode('utf-8').strip()
+                    counts = revisions.setdefault(author, {"insertions": 0, "deletions": 0})
+                    counts["insertions" if match.group(1) == b'ins' else "deletions"] += 1
+                for match in pattern_comment.finditer(content):
+                    author = match.group(2).decode('utf-8').strip()
+                    comments[author] = comments.get(author, 0) + 1
+                for match in CREATOR_ELEMENT.finditer(content):
+                    creators.add(match.group(2).decode('utf-8').strip())
+                for match in LAST_MODIFIED_BY_ELEMENT.finditer(content):
+                    last_modified_by.add(match.group(2).decode('utf-8').strip())
+
+    return {
+        "revisions": revisions,
+        "comments": comments,
+        "creator": sorted(creators),
+        "last_modified_by": sorted(last_modified_by),
+    }
+
+def _sanitize_xml_part(content, target_authors, new_author_bytes, new_initials_bytes, remove_highlights,
+                       cancel_token=None, report=True):
+    """
+    Applies the sanitize transforms to one XML part and returns the new content.
+    Shared by the outer document and by embedded packages.
+    """
+    # regex patterns for replacing initials
+    # We look for w:initials="Value"
     # Using byte strings for regex since we read files as bytes
-    
-    pattern_author_double = re.compile(rb'((?:w|w15):author=")([^"]*)(")')
-    pattern_author_single = re.compile(rb"((?:w|w15):author=')([^']*)(')")
-    
     pattern_initials_double = re.compile(rb'(w:initials=")([^"]*)(")')
     pattern_initials_single = re.compile(rb"(w:initials=')([^']*)(')")
 
-    # Metadata element patterns
-    pattern_el_creator = re.compile(rb'(<dc:creator>)(.*?)(</dc:creator>)')
-    pattern_el_lastmod = re.compile(rb'(<cp:lastModifiedBy>)(.*?)(</cp:lastModifiedBy>)')
-
     # Highlight patterns
     # Matches <w:highlight ... /> or <w15:highlight ... />
     # We want to remove the entire tag.
     pattern_highlight = re.compile(rb'(<w(?:15)?:highlight[^>]*/>)')
 
+    if remove_highlights:
+        # Remove highlight tags
+        content = pattern_highlight.sub(rb'', content)
+    
+    # Only proceed with author replacement if target_authors is provided
+    if target_authors:
+        # Apply global string replacement for each selected author
+        # This covers: attributes, metadata elements, AND body text/field results.
+        for author_index, author in enumerate(target_authors):
+            _checkpoint(cancel_token, report=report, fraction=author_index / len(target_authors))
+            author_bytes = author.encode('utf-8')
+            # Simple replace
+            # Note: This replaces ALL occurrences of the author name.
+            if author_bytes in content:
+                content = content.replace(author_bytes, new_author_bytes)
+        
+        # We still run the regex for INITIALS separately because Initials are NOT in the target_authors list
+        # (target_authors are full names). 
+        # The user wants to replace "Zhang, Lin" (Author) -> "NewName".
+        # Implicitly, they might want to replace Initials too.
+        # Our previous logic replaced ALL initials blindly. We will keep that for safety/anonymization.
+        
+        content = pattern_initials_double.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
+        content = pattern_initials_single.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
+    return content
+
+def _is_sanitized_xml(filename):
+    # SKIP people.xml to avoid duplicate author entries when multiple users edit with same name
+    return filename.endswith('.xml') and filename != 'word/people.xml'
+
+def _is_embedded_package(filename):
+    return EMBEDDED_PACKAGE.match(filename) is not None
+
+def _package_needs_sanitize(zin, target_authors, remove_highlights, depth):
+    """
+    Cheap scan (inflate only, no rewrite) of an embedded package: True if any XML part would
+    change, or if it embeds further packages that are still within the depth limit.
+    """
+    author_bytes = [a.encode('utf-8') for a in target_authors]
+    for item in zin.infolist():
+        if _is_embedded_package(item.filename) and depth < EMBEDDING_MAX_DEPTH:
+            return True
+        if not _is_sanitized_xml(item.filename):
+            continue
+        content = zin.read(item.filename)
+        if remove_highlights and b'highlight' in content:
+            return True
+        if author_bytes and (b'w:initials=' in content or any(a in content for a in author_bytes)):
+            return True
+    return False
+
+def _skip_embedding(skipped, path, reason):
+    """Logs an embedded package left unchanged and adds (path, reason) to the skipped list, if any."""
+    logger.warning("embeddings: %s %s, left unchanged", path, reason)
+    if skipped is not None:
+        skipped.append((path, reason))
+
+def _sanitize_embedding(data, target_authors, new_author_bytes, new_initials_bytes, remove_highlights,
+                        depth, cancel_token=None, path=None, skipped=None):
+    """
+    Sanitizes an embedded Office package (bytes) recursively with the same author mapping.
+    Packages that are unreadable or have nothing to change are returned as-is (the same object);
+    members left unchanged by a rewrite are copied without being inflated and re-deflated.
+
+    Packages over EMBEDDING_MAX_MB or MAX_UNCOMPRESSED_MB, and packages nested deeper than
+    EMBEDDING_MAX_DEPTH, are left unchanged and reported in skipped as (path, reason), where
+    path joins the member names from the outer document down ("outer.docx/inner.xlsx").
+    Runs in worker threads, so cancellation is checked without touching the UI.
+    """
+    if len(data) > EMBEDDING_MAX_MB * 1024 * 1024:
+        _skip_embedding(skipped, path, f"is larger than {EMBEDDING_MAX_MB} MB")
+        return data
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data), 'r') as zin:
+            infos = zin.infolist()
+            if sum(i.file_size for i in infos) > MAX_UNCOMPRESSED_MB * 1024 * 1024:
+                _skip_embedding(skipped, path, f"expands beyond {MAX_UNCOMPRESSED_MB} MB")
+                return data
+            if depth >= EMBEDDING_MAX_DEPTH:
+                for item in infos:
+                    if _is_embedded_package(item.filename):
+                        _skip_embedding(skipped, f"{path}/{item.filename}",
+                                        f"is nested deeper than {EMBEDDING_MAX_DEPTH} levels")
+            if not _package_needs_sanitize(zin, target_authors, remove_highlights, depth):
+                return data
+
+            output_buffer = io.BytesIO()
+            with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
+                for item in infos:
+                    _checkpoint(cancel_token, report=False)
+                    if _is_embedded_package(item.filename) and depth < EMBEDDING_MAX_DEPTH:
+                        # Nested levels are processed sequentially to keep parallelism bounded
+                        content = zin.read(item.filename)
+                        result = _sanitize_embedding(content, target_authors, new_author_bytes, new_initials_bytes,
+                                                     remove_highlights, depth + 1, cancel_token,
+                                                     f"{path}/{item.filename}", skipped)
+                        if result is not content:
+                            zout.writestr(item, result)
+                            continue
+                    elif _is_sanitized_xml(item.filename):
+                        content = _sanitize_xml_part(zin.read(item.filename), target_authors, new_author_bytes,
+                                                     new_initials_bytes, remove_highlights, cancel_token, report=False)
+                        zout.writestr(item, content)
+                        continue
+                    _copy_raw_member(zin, zout, item)
+            return output_buffer.getvalue()
+    except zipfile.BadZipFile:
+        # OLE objects and other binaries can carry an Office extension; leave them alone
+        return data
+
+def _embedding_window(streaming):
+    """How many embedded packages process_docx holds in memory ahead of the writer."""
+    return EMBEDDING_WORKERS if streaming else 2 * EMBEDDING_WORKERS
+
+@contextmanager
+def _embedding_pool():
+    """Thread pool for embedded packages; queued work is dropped if processing stops early."""
+    pool = ThreadPoolExecutor(max_workers=EMBEDDING_WORKERS)
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def process_docx(uploaded_file, target_authors, new_author_name, new_initials, remove_highlights=False,
+                 streaming=False, memory_stats=None, cancel_token=None, skipped=None):
+    """
+    Reads a docx file (as a zip), modifies XML content in memory to replace author names and initials,
+    and returns a bytes object of the new docx file.
+
+    Office packages under word/embeddings/ are sanitized recursively with the same mapping,
+    in a bounded thread pool (see EMBEDDING_WORKERS / EMBEDDING_MAX_DEPTH / EMBEDDING_MAX_MB).
+    Embedded packages with nothing to change keep their original compressed bytes. Packages left
+    unchanged because of a limit are appended to skipped (a list, if given) as (path, reason).
+
+    With streaming=True, non-XML members are copied in chunks and the output is spooled
+    to a temp file, which is returned (rewound) instead of bytes.
+    cancel_token (CancelToken) is checked between parts and between authors.
+    """
+    # Create a buffer for the new docx
+    output_buffer = _open_output(streaming)
+
     # Convert new values to bytes (utf-8)
     new_author_bytes = new_author_name.encode('utf-8')
     new_initials_bytes = new_initials.encode('utf-8')
 
     try:
-        with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        with zipfile.ZipFile(uploaded_file, 'r') as zin, _embedding_pool() as pool:
+            infos = zin.infolist()
+
+            # Embeddings are read here (zipfile isn't safe for concurrent reads) and processed
+            # in the pool, at most _embedding_window(streaming) packages ahead of the writer.
+            # Oversized ones are never read; the writer copies them as they are.
+            embeddings = iter([i for i in infos if _is_embedded_package(i.filename)])
+            pending = {}
+
+            def prefetch():
+                while len(pending) < _embedding_window(streaming):
+                    nxt = next(embeddings, None)
+                    if nxt is None:
+                        return
+                    if nxt.file_size > EMBEDDING_MAX_MB * 1024 * 1024:
+                        _skip_embedding(skipped, nxt.filename, f"is larger than {EMBEDDING_MAX_MB} MB")
+                        continue
+                    data = zin.read(nxt.filename)
+                    pending[nxt] = (data, pool.submit(
+                        _sanitize_embedding, data, target_authors, new_author_bytes,
+                        new_initials_bytes, remove_highlights, 1, cancel_token, nxt.filename, skipped
+                    ))
+
             with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
-                for item in zin.infolist():
+                for index, item in enumerate(infos):
+                    _enter_part(cancel_token, index, len(infos))
+
+                    if _is_embedded_package(item.filename):
+                        prefetch()
+                        data, future = pending.pop(item, (None, None))
+                        content = future.result() if future else None
+                        prefetch()
+                        if content is None or content is data:
+                            _copy_raw_member(zin, zout, item)
+                        else:
+                            zout.writestr(item, content)
+                        del data, content
+                        record_part_memory(memory_stats, item.filename)
+                        continue
+
+                    if streaming and not item.filename.endswith('.xml'):
+                        _copy_member(zin, zout, item)
+                        record_part_memory(memory_stats, item.filename)
+                        continue
+
                     content = zin.read(item.filename)
                     
                     # We only want to modify XML files that might contain author info.
                     # Usually these are word/document.xml, word/comments.xml, word/settings.xml, etc.
                     # To be safe and comprehensive, we can check typical xml files or just all .xml files.
-                    # SKIP people.xml to avoid duplicate author entries when multiple users edit with same name
-                    if item.filename.endswith('.xml') and item.filename != 'word/people.xml':
-                        
-                        if remove_highlights:
-                            # Remove highlight tags
-                            content = pattern_highlight.sub(rb'', content)
-                        
-                        # Only proceed with author replacement if target_authors is provided
-                        if target_authors:
-                            # Apply global string replacement for each selected author
-                            # This covers: attributes, metadata elements, AND body text/field results.
-                            for author in target_authors:
-                                author_bytes = author.encode('utf-8')
-                                # Simple replace
-                                # Note: This replaces ALL occurrences of the author name.
-                                if author_bytes in content:
-                                    content = content.replace(author_bytes, new_author_bytes)
-                            
-                            # We still run the regex for INITIALS separately because Initials are NOT in the target_authors list
-                            # (target_authors are full names). 
-                            # The user wants to replace "Zhang, Lin" (Author) -> "NewName".
-                            # Implicitly, they might want to replace Initials too.
-                            # Our previous logic replaced ALL initials blindly. We will keep that for safety/anonymization.
-                            
-                            content = pattern_initials_double.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
-                            content = pattern_initials_single.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
+                    if _is_sanitized_xml(item.filename):
+                        content = _sanitize_xml_part(content, target_authors, new_author_bytes, new_initials_bytes,
+                                                     remove_highlights, cancel_token)
                     
                     # Write content (modified or original) to the new zip
                     zout.writestr(item, content)
+                    del content
+                    record_part_memory(memory_stats, item.filename)
                     
-        return output_buffer.getvalue()
+        return _finish_output(output_buffer, streaming)
 
     except zipfile.BadZipFile:
         st.error("Error: The uploaded file is not a valid docx or zip file.")
         return None
+    except OperationCancelled as e:
+        st.warning(f"Processing stopped: {e}.")
+        return None
     except Exception as e:
         st.error(f"An unexpected error occurred: {e}")
         return None
 
-def apply_author_highlights(uploaded_file, author_colors):
+def apply_author_highlights(uploaded_file, author_colors, streaming=False, memory_stats=None, cancel_token=None):
     """
     Applies highlight colors to tracked changes (insertions/deletions) by specific authors.
     
     Args:
         uploaded_file: The docx file as a file-like object
         author_colors: Dict mapping author name to highlight color name (e.g., {'John': 'yellow'})
+        streaming: Copy non-XML members in chunks and spool the output to a temp file
+        memory_stats: Stats dict from track_memory(), or None
+        cancel_token: CancelToken checked between parts and between authors, or None
     
     Returns:
-        Bytes of the modified docx file, or None on error
+        Bytes of the modified docx file (temp file if streaming), or None on error
     """
-    output_buffer = io.BytesIO()
+    output_buffer = _open_output(streaming)
     
     try:
         with zipfile.ZipFile(uploaded_file, 'r') as zin:
             with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
-                for item in zin.infolist():
+                infos = zin.infolist()
+                for index, item in enumerate(infos):
+                    _enter_part(cancel_token, index, len(infos))
+                    if streaming and not item.filename.endswith('.xml'):
+                        _copy_member(zin, zout, item)
+                        record_part_memory(memory_stats, item.filename)
+                        continue
+
                     content = zin.read(item.filename)
                     
                     # Skip people.xml to avoid any modifications to presence info
                     if item.filename.endswith('.xml') and item.filename != 'word/people.xml':
+                        # For progress within the part (the callback below must not hold on to content)
+                        part_length = len(content) or 1
                         # Process each author's revisions
-                        for author, color in author_colors.items():
+                        for author_index, (author, color) in enumerate(author_colors.items()):
+                            _checkpoint(cancel_token, fraction=author_index / len(author_colors))
                             author_bytes = author.encode('utf-8')
                             highlight_tag = f'<w:highlight w:val="{color}"/>'.encode('utf-8')
                             
@@ -216,6 +1025,9 @@ def apply_author_highlights(uploaded_file, author_colors):
                             
                             def add_highlight_to_runs(m):
                                 """Add highlight to all w:r elements within the matched block"""
+                                # Insertions are the first half of this author's share, deletions the second
+                                pass_fraction = (highlight_pass + min(m.start() / part_length, 1.0)) / 2
+                                _checkpoint(cancel_token, fraction=(author_index + pass_fraction) / len(author_colors))
                                 opening = m.group(1)
                                 inner = m.group(2)
                                 closing = m.group(3)
@@ -257,21 +1069,210 @@ def apply_author_highlights(uploaded_file, author_colors):
                                 
                                 return opening + inner + closing
                             
-                            content = ins_pattern.sub(add_highlight_to_runs, content)
-                            content = del_pattern.sub(add_highlight_to_runs, content)
+                            for highlight_pass, block_pattern in enumerate((ins_pattern, del_pattern)):
+                                content = block_pattern.sub(add_highlight_to_runs, content)
                     
                     zout.writestr(item, content)
+                    del content
+                    record_part_memory(memory_stats, item.filename)
                     
-        return output_buffer.getvalue()
+        return _finish_output(output_buffer, streaming)
         
     except zipfile.BadZipFile:
         st.error("Error: The uploaded file is not a valid docx or zip file.")
         return None
+    except OperationCancelled as e:
+        st.warning(f"Processing stopped: {e}.")
+        return None
+    except Exception as e:
+        st.error(f"An unexpected error occurred: {e}")
+        return None
+
+# Tokens touched by revision resolution: revision wrappers and deleted-text elements.
+# The lookahead stops w:del from matching w:delText.
+REVISION_TOKEN = re.compile(
+    rb'<(/?)w:(ins|del|moveFromRangeStart|moveFromRangeEnd|moveToRangeStart|moveToRangeEnd'
+    rb'|moveFrom|moveTo|delText|delInstrText)(?=[\s/>])([^>]*?)(/?)>'
+)
+REVISION_AUTHOR = re.compile(rb'w:author="([^"]*)"')
+REVISION_ID = re.compile(rb'w:id="([^"]*)"')
+
+# Move ranges bracket a move; their markers go with it once the move is resolved
+MOVE_RANGE_STARTS = {b'moveFromRangeStart': b'moveFrom', b'moveToRangeStart': b'moveTo'}
+MOVE_RANGE_ENDS = {b'moveFromRangeEnd': b'moveFrom', b'moveToRangeEnd': b'moveTo'}
+
+# Insertion-like wrappers are kept on accept; deletion-like wrappers are kept on reject
+INSERTION_TAGS = (b'ins', b'moveTo')
+DELETION_TAGS = (b'del', b'moveFrom')
+
+# Deleted text restored on reject becomes regular text again
+RESTORED_TEXT_TAGS = {b'delText': b't', b'delInstrText': b'instrText'}
+
+def resolve_revisions_part(content, accept_authors, reject_authors, cancel_token=None, check_every=10000,
+                           left_tracked=None):
+    """
+    Accepts or rejects tracked changes by author in a single forward pass over one XML part.
+
+    - Accepted insertions (w:ins, w:moveTo) are unwrapped; rejected ones are dropped.
+    - Accepted deletions (w:del, w:moveFrom) are dropped; rejected ones are unwrapped and
+      their w:delText/w:delInstrText turned back into w:t/w:instrText.
+    - Self-closing markers (paragraph marks, table rows) are removed when the change is kept
+      as-is in the document (accepted insertion / rejected deletion). Otherwise the paragraph
+      or row would have to be merged or removed, so they stay tracked for Word; the author of
+      each one is appended to left_tracked (a list, if given).
+    - Move range markers (w:moveFromRangeStart/End, w:moveToRangeStart/End) of a resolved
+      move are removed, matched by w:id.
+    - Revisions by authors in neither set are left untouched.
+
+    cancel_token is checked every check_every tokens.
+    """
+    accept = {a.strip() for a in accept_authors}
+    reject = {a.strip() for a in reject_authors}
+
+    out = []
+    pos = 0
+    stack = []  # (tag name, action) for each open revision wrapper
+    drop_depth = 0
+    resolved_ranges = set()  # (move kind, w:id) of move ranges whose start marker was removed
+
+    def decide(name, attrs):
+        match = REVISION_AUTHOR.search(attrs)
+        author = match.group(1).decode('utf-8').strip() if match else None
+        if author in accept:
+            return 'unwrap' if name in INSERTION_TAGS else 'drop'
+        if author in reject:
+            return 'drop' if name in INSERTION_TAGS else 'unwrap'
+        return 'keep'
+
+    for count, m in enumerate(REVISION_TOKEN.finditer(content), 1):
+        if count % check_every == 0:
+            _checkpoint(cancel_token, fraction=m.start() / len(content))
+        closing, name, attrs, self_closing = m.group(1), m.group(2), m.group(3), m.group(4)
+
+        if drop_depth == 0:
+            out.append(content[pos:m.start()])
+        pos = m.end()
+
+        if name in RESTORED_TEXT_TAGS:
+            if drop_depth:
+                continue
+            # Restore only if the innermost deletion wrapper is being rejected
+            innermost = next((action for tag, action in reversed(stack) if tag in DELETION_TAGS), None)
+            if innermost == 'unwrap':
+                out.append(b'<' + closing + b'w:' + RESTORED_TEXT_TAGS[name] + attrs + self_closing + b'>')
+            else:
+                out.append(m.group(0))
+            continue
+
+        if name in MOVE_RANGE_STARTS:
+            if drop_depth or decide(name, attrs) != 'keep':
+                match = REVISION_ID.search(attrs)
+                resolved_ranges.add((MOVE_RANGE_STARTS[name], match.group(1) if match else None))
+            else:
+                out.append(m.group(0))
+            continue
+
+        if name in MOVE_RANGE_ENDS:
+            match = REVISION_ID.search(attrs)
+            if drop_depth == 0 and (MOVE_RANGE_ENDS[name], match.group(1) if match else None) not in resolved_ranges:
+                out.append(m.group(0))
+            continue
+
+        if self_closing:
+            # Paragraph/row structure can't be merged or split here; such markers stay tracked
+            if drop_depth == 0:
+                action = decide(name, attrs)
+                if action != 'unwrap':
+                    out.append(m.group(0))
+                if action == 'drop' and left_tracked is not None:
+                    left_tracked.append(REVISION_AUTHOR.search(attrs).group(1).decode('utf-8').strip())
+            continue
+
+        if not closing:
+            action = decide(name, attrs)
+            stack.append((name, action))
+            if action == 'drop':
+                drop_depth += 1
+            elif action == 'keep' and drop_depth == 0:
+                out.append(m.group(0))
+            continue
+
+        # Closing tag; an unmatched one is passed through unchanged
+        if not stack or stack[-1][0] != name:
+            if drop_depth == 0:
+                out.append(m.group(0))
+            continue
+        _, action = stack.pop()
+        if action == 'drop':
+            drop_depth -= 1
+        elif action == 'keep' and drop_depth == 0:
+            out.append(m.group(0))
+
+    if drop_depth == 0:
+        out.append(content[pos:])
+    return b''.join(out)
+
+def resolve_revisions(uploaded_file, accept_authors, reject_authors, streaming=False, memory_stats=None,
+                      cancel_token=None, left_tracked=None):
+    """
+    Accepts tracked changes from accept_authors and rejects those from reject_authors
+    in every XML part, producing a document without those revisions, except for paragraph
+    and table-row marks that would need the structure changed (see resolve_revisions_part);
+    those stay tracked and their authors are appended to left_tracked (a list, if given).
+
+    Returns:
+        Bytes of the modified docx file (temp file if streaming), or None on error
+    """
+    output_buffer = _open_output(streaming)
+
+    try:
+        with zipfile.ZipFile(uploaded_file, 'r') as zin:
+            with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
+                infos = zin.infolist()
+                for index, item in enumerate(infos):
+                    _enter_part(cancel_token, index, len(infos))
+                    if streaming and not item.filename.endswith('.xml'):
+                        _copy_member(zin, zout, item)
+                        record_part_memory(memory_stats, item.filename)
+                        continue
+
+                    content = zin.read(item.filename)
+
+                    # Skip people.xml, consistent with the other operations
+                    if item.filename.endswith('.xml') and item.filename != 'word/people.xml':
+                        # Cheap pre-check: most parts carry no revisions at all
+                        if b'<w:ins' in content or b'<w:del' in content or b'<w:move' in content:
+                            content = resolve_revisions_part(content, accept_authors, reject_authors, cancel_token,
+                                                             left_tracked=left_tracked)
+
+                    zout.writestr(item, content)
+                    del content
+                    record_part_memory(memory_stats, item.filename)
+
+        return _finish_output(output_buffer, streaming)
+
+    except zipfile.BadZipFile:
+        st.error("Error: The uploaded file is not a valid docx or zip file.")
+        return None
+    except OperationCancelled as e:
+        st.warning(f"Processing stopped: {e}.")
+        return None
     except Exception as e:
         st.error(f"An unexpected error occurred: {e}")
         return None
 
+def configure_logging():
+    """Sends the app logger to stderr at LOG_LEVEL. Idempotent, since main() runs on every rerun."""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        logger.addHandler(handler)
+        # The handler is ours; don't print the same line again through a root handler
+        logger.propagate = False
+    logger.setLevel(LOG_LEVEL)
+
 def main():
+    configure_logging()
     st.set_page_config(page_title="WordConsolidation", page_icon="📝")
     
     st.title("WordConsolidation 📝")
@@ -280,12 +1281,24 @@ def main():
     
     # State management callbacks
     def reset_sanitize_state():
+        cancel_job('sanitize_job', "a new file was uploaded")
+        release_input_source('sanitize_source')
         st.session_state.pop('sanitized_data', None)
         st.session_state.pop('sanitized_filename', None)
+        st.session_state.pop('sanitized_skipped', None)
 
     def reset_highlight_state():
+        cancel_job('highlight_job', "a new file was uploaded")
+        release_input_source('highlight_source')
+        st.session_state.pop('author_table', None)
+        st.session_state.pop('author_page', None)
+        st.session_state.pop('browse_pages', None)
+        st.session_state.pop('browse_filters', None)
         st.session_state.pop('highlighted_data', None)
         st.session_state.pop('highlighted_filename', None)
+        st.session_state.pop('resolved_data', None)
+        st.session_state.pop('resolved_filename', None)
+        st.session_state.pop('resolved_left_tracked', None)
     
     with tab_sanitize:
         st.markdown("""
@@ -295,6 +1308,9 @@ def main():
         
         **Privacy Note:** All processing is done in-memory. Your files are not saved to the server.
         """)
+        if DISK_SPOOLING:
+            st.caption("This server spools large uploads to anonymous temporary files while they are processed. "
+                       "They are never named on disk and are deleted when the upload is closed or replaced.")
         
         # Sidebar for inputs - NOTE: Sidebars are global, but we can keep the code here or move it out if we want it to persist across tabs.
         # Usually sidebar config is fine to stay global or be defined here.
@@ -302,17 +1318,27 @@ def main():
             st.header("Configuration")
             new_name = st.text_input("New Author Name", value="BR/TSD/FMD")
             new_initials = st.text_input("New Initials", value="FMD")
+
+            # Filled at the end of the run, after any operation has recorded its stats
+            memory_panel = st.empty() if MEMORY_ACCOUNTING else None
         
         # File uploader
         uploaded_file = st.file_uploader("Choose a Word Document", type=["docx"], key="sanitize_uploader", on_change=reset_sanitize_state)
         
+        probe = None
         if uploaded_file is not None:
-            # Show file details
-            file_details = {"FileName": uploaded_file.name, "FileType": uploaded_file.type, "FileSize": f"{uploaded_file.size / 1024:.2f} KB"}
-            st.write(file_details)
+            # Show file details and reject bad packages before any decompression
+            probe = probe_docx(uploaded_file)
+            render_file_details(uploaded_file, probe)
+            if not probe["valid"]:
+                st.error(f"Error: {probe['error']}")
+        
+        if probe is not None and probe["valid"]:
+            # Large uploads are read through one cached mmap by every pass below
+            source = input_source(uploaded_file, 'sanitize_source')
             
             # Extract authors
-            all_authors = extract_authors(uploaded_file)
+            all_authors = extract_authors(source)
             
             # Author selection
             st.subheader("Select Authors to Modify")
@@ -332,15 +1358,38 @@ def main():
             
             # Process button
             if st.button("Process Document"):
-                with st.spinner("Processing document..."):
-                    processed_data = process_docx(uploaded_file, target_authors, new_name, new_initials, remove_highlights=remove_highlights)
+                processed_data = None
+                skipped = []
+                mode = check_memory_budget(source)
+                if mode == "reject":
+                    st.error(f"This document is too large to process within the {MEMORY_BUDGET_MB} MB memory budget.")
+                else:
+                    job = start_job('sanitize_job', "Processing document...")
+                    try:
+                        with track_memory("process_docx") as memory_stats:
+                            processed_data = process_docx(
+                                source, target_authors, new_name, new_initials,
+                                remove_highlights=remove_highlights,
+                                streaming=(mode == "stream"), memory_stats=memory_stats, cancel_token=job,
+                                skipped=skipped
+                            )
+                    finally:
+                        finish_job('sanitize_job', job)
+                    if memory_stats is not None:
+                        st.session_state['memory_stats'] = memory_stats
                     
                 if processed_data:
-                    st.session_state['sanitized_data'] = processed_data
+                    st.session_state['sanitized_data'] = _as_download_data(processed_data)
                     st.session_state['sanitized_filename'] = f"consolidated_{uploaded_file.name}"
+                    st.session_state['sanitized_skipped'] = skipped
                     
             if 'sanitized_data' in st.session_state:
                 st.success("Processing complete!")
+                if st.session_state.get('sanitized_skipped'):
+                    st.warning(
+                        "These embedded objects were left unchanged and may still contain the original author names:\n"
+                        + "\n".join(f"- `{path}` {reason}" for path, reason in st.session_state['sanitized_skipped'])
+                    )
                 
                 # Create a download button
                 st.download_button(
@@ -369,68 +1418,157 @@ def main():
         # File uploader for highlight tab
         highlight_file = st.file_uploader("Choose a Word Document", type=["docx"], key="highlight_uploader", on_change=reset_highlight_state)
         
+        probe = None
         if highlight_file is not None:
-            # Show file details
-            file_details = {"FileName": highlight_file.name, "FileType": highlight_file.type, "FileSize": f"{highlight_file.size / 1024:.2f} KB"}
-            st.write(file_details)
+            # Show file details and reject bad packages before any decompression
+            probe = probe_docx(highlight_file)
+            render_file_details(highlight_file, probe)
+            if not probe["valid"]:
+                st.error(f"Error: {probe['error']}")
+        
+        if probe is not None and probe["valid"]:
+            # Large uploads are read through one cached mmap by every pass below
+            highlight_source = input_source(highlight_file, 'highlight_source')
             
-            # Extract revision authors
-            revision_authors = extract_revision_authors(highlight_file)
+            # Extract revision authors once per upload; reruns reuse the cached list
+            if st.session_state.get('revision_authors_file_id') != highlight_file.file_id:
+                st.session_state['revision_authors'] = extract_revision_authors(highlight_source)
+                st.session_state['revision_authors_file_id'] = highlight_file.file_id
+                st.session_state.pop('author_table', None)
+            revision_authors = st.session_state['revision_authors']
             
             if not revision_authors:
                 st.warning("No tracked changes found in this document. Make sure the document has revisions (insertions/deletions).")
             else:
                 st.subheader("Select Authors & Assign Colors")
                 
-                # Callback for Select All
-                def toggle_all():
-                    val = st.session_state.select_all_authors
-                    for i in range(len(revision_authors)):
-                        st.session_state[f"include_{i}"] = val
-
-                st.checkbox("Select All", value=True, key="select_all_authors", on_change=toggle_all)
-                
                 # Create color options with preview
                 color_options = list(HIGHLIGHT_COLORS.keys())
                 
+                # Author selections live in one session-held table: author -> {include, color}
+                if 'author_table' not in st.session_state:
+                    st.session_state['author_table'] = {
+                        author: {"include": True, "color": color_options[idx % len(color_options)]}  # Rotate default colors
+                        for idx, author in enumerate(revision_authors)
+                    }
+                    st.session_state['author_table_version'] = 0
+                author_table = st.session_state['author_table']
+                
+                # Search and pagination over the data we already hold
+                col_search, col_page_size = st.columns([3, 1])
+                with col_search:
+                    query = st.text_input("Search authors", key="author_search", placeholder="Type to filter...")
+                with col_page_size:
+                    page_size = st.selectbox("Per page", options=AUTHOR_PAGE_SIZES, index=1, key="author_page_size")
+                
+                matching_authors = filter_authors(revision_authors, query)
+                page_count = max(1, -(-len(matching_authors) // page_size))
+                # Clamp a stale page (e.g. after narrowing the search) before the widget is created
+                if st.session_state.get('author_page', 1) > page_count:
+                    st.session_state['author_page'] = page_count
+                page = st.number_input(
+                    f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key="author_page"
+                ) if page_count > 1 else 1
+                page_authors = paginate(matching_authors, page, page_size)
+                st.caption(f"{len(matching_authors)} of {len(revision_authors)} authors match.")
+                
+                # Bulk actions apply to every author matching the search, not just the visible page
+                def bulk_update(include=None, color=None):
+                    for author in filter_authors(revision_authors, st.session_state.get('author_search', '')):
+                        row = st.session_state['author_table'][author]
+                        if include is not None:
+                            row["include"] = include
+                        if color is not None and row["include"]:
+                            row["color"] = color
+                    # New editor key so stale cell edits don't override the bulk change
+                    st.session_state['author_table_version'] += 1
+                
+                col_sel, col_clear, col_bulk_color, col_bulk_apply = st.columns([1, 1, 1.5, 1])
+                with col_sel:
+                    st.button("Select all", key="bulk_select", on_click=bulk_update, kwargs={"include": True})
+                with col_clear:
+                    st.button("Clear all", key="bulk_clear", on_click=bulk_update, kwargs={"include": False})
+                with col_bulk_color:
+                    bulk_color = st.selectbox("Bulk color", options=color_options, key="bulk_color", label_visibility="collapsed")
+                with col_bulk_apply:
+                    st.button("Set color", key="bulk_apply_color", on_click=bulk_update, kwargs={"color": bulk_color},
+                              help="Assign this color to all selected authors matching the search.")
+                
+                # One editable table for the visible page
+                edited = st.data_editor(
+                    pd.DataFrame({
+                        "Include": [author_table[a]["include"] for a in page_authors],
+                        "Author": page_authors,
+                        "Color": [author_table[a]["color"] for a in page_authors],
+                    }),
+                    column_config={
+                        "Include": st.column_config.CheckboxColumn("Include", width="small"),
+                        "Author": st.column_config.TextColumn("Author", disabled=True),
+                        "Color": st.column_config.SelectboxColumn("Color", options=color_options, required=True),
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"author_editor_{st.session_state['author_table_version']}_{page}_{query}_{page_size}",
+                )
+                for row in edited.itertuples(index=False):
+                    author_table[row.Author] = {"include": bool(row.Include), "color": row.Color}
+                
                 # Store author-color mappings
-                author_color_selections = {}
+                author_color_selections = {
+                    author: author_table[author]["color"]
+                    for author in revision_authors if author_table[author]["include"]
+                }
+                st.caption(f"{len(author_color_selections)} authors selected.")
                 
-                # Create a grid of author selections with color pickers
-                for idx, author in enumerate(revision_authors):
-                    col1, col2, col3, col4 = st.columns([0.5, 2, 2.5, 0.5])
+                # Revision browser: nothing is scanned until it is switched on
+                if st.toggle("Browse revisions", key="browse_revisions"):
+                    col_auth, col_kind, col_size = st.columns([3, 2, 1])
+                    with col_auth:
+                        browse_authors = st.multiselect("Authors", options=revision_authors, key="browse_authors",
+                                                        placeholder="All authors")
+                    with col_kind:
+                        browse_kinds = st.multiselect("Types", options=["ins", "del"], key="browse_kinds",
+                                                      format_func=lambda k: REVISION_KIND_LABELS[k.encode('ascii')],
+                                                      placeholder="All types")
+                    with col_size:
+                        browse_page_size = st.selectbox("Per page", options=[25, 50, 100], key="browse_page_size")
                     
-                    with col1:
-                        # Checkbox to include this author
-                        # Avoid "widget with key... created with default value" warning
-                        if f"include_{idx}" not in st.session_state:
-                             st.session_state[f"include_{idx}"] = True
-                        
-                        include = st.checkbox("", key=f"include_{idx}")
+                    # Cursors of the pages visited so far and the pages fetched (by cursor);
+                    # both reset whenever the file or the filters change
+                    browse_filters = (highlight_file.file_id, tuple(browse_authors), tuple(browse_kinds), browse_page_size)
+                    if st.session_state.get('browse_filters') != browse_filters:
+                        st.session_state['browse_filters'] = browse_filters
+                        st.session_state['browse_cursors'] = [None]
+                        st.session_state['browse_pages'] = {}
+                    cursors = st.session_state['browse_cursors']
+                    pages = st.session_state['browse_pages']
+                    
+                    # Reruns (any widget change) reuse the page instead of rescanning the document
+                    if cursors[-1] not in pages:
+                        pages[cursors[-1]] = fetch_revisions(
+                            highlight_source, cursor=cursors[-1], limit=browse_page_size,
+                            authors=browse_authors, kinds=browse_kinds
+                        )
+                    rows, next_cursor = pages[cursors[-1]]
+                    if rows:
+                        st.dataframe(rows, hide_index=True, use_container_width=True)
+                    else:
+                        st.caption("No revisions match these filters.")
                     
-                    with col2:
-                        st.write(f"**{author}**")
+                    def browse_prev():
+                        st.session_state['browse_cursors'].pop()
                     
-                    with col3:
-                        if include:
-                            # Color selector with preview
-                            color_name = st.selectbox(
-                                "Color",
-                                options=color_options,
-                                index=idx % len(color_options),  # Rotate default colors
-                                key=f"color_{idx}",
-                                label_visibility="collapsed"
-                            )
-                            author_color_selections[author] = color_name
+                    def browse_next(cursor):
+                        st.session_state['browse_cursors'].append(cursor)
                     
-                    with col4:
-                        if include:
-                            # Show color preview inline
-                            hex_color = HIGHLIGHT_COLORS[color_name]
-                            st.markdown(
-                                f'<div style="width:100%;height:38px;background-color:{hex_color};border-radius:4px;border:1px solid #ccc;margin-top:0px;"></div>',
-                                unsafe_allow_html=True
-                            )
+                    col_prev, col_page, col_next = st.columns([1, 2, 1])
+                    with col_prev:
+                        st.button("◀ Previous", key="browse_prev", on_click=browse_prev, disabled=len(cursors) == 1)
+                    with col_page:
+                        st.caption(f"Page {len(cursors)}")
+                    with col_next:
+                        st.button("Next ▶", key="browse_next", on_click=browse_next, args=(next_cursor,),
+                                  disabled=next_cursor is None)
                 
                 # Color legend
                 with st.expander("View All Available Colors"):
@@ -449,13 +1587,25 @@ def main():
                     if not author_color_selections:
                         st.warning("Please select at least one author to highlight.")
                     else:
-                        with st.spinner("Applying highlights..."):
-                            # Reset file position
-                            highlight_file.seek(0)
-                            processed_data = apply_author_highlights(highlight_file, author_color_selections)
+                        processed_data = None
+                        mode = check_memory_budget(highlight_source)
+                        if mode == "reject":
+                            st.error(f"This document is too large to process within the {MEMORY_BUDGET_MB} MB memory budget.")
+                        else:
+                            job = start_job('highlight_job', "Applying highlights...")
+                            try:
+                                with track_memory("apply_author_highlights") as memory_stats:
+                                    processed_data = apply_author_highlights(
+                                        highlight_source, author_color_selections,
+                                        streaming=(mode == "stream"), memory_stats=memory_stats, cancel_token=job
+                                    )
+                            finally:
+                                finish_job('highlight_job', job)
+                            if memory_stats is not None:
+                                st.session_state['memory_stats'] = memory_stats
                         
                         if processed_data:
-                            st.session_state['highlighted_data'] = processed_data
+                            st.session_state['highlighted_data'] = _as_download_data(processed_data)
                             st.session_state['highlighted_filename'] = f"highlighted_{highlight_file.name}"
                             st.session_state['prev_color_selections'] = author_color_selections
 
@@ -488,6 +1638,62 @@ def main():
                         key="download_highlighted"
                     )
 
+                # Resolve revisions (accept/reject by author)
+                st.subheader("Resolve Revisions")
+                st.markdown("Accept or reject the tracked text changes by selected authors. Authors left in neither list are kept as tracked changes. "
+                            "Inserted or deleted paragraph marks and table rows whose resolution would change the document structure stay tracked for Word.")
+                accept_authors = st.multiselect("Accept changes from", options=revision_authors, key="accept_authors")
+                reject_authors = st.multiselect(
+                    "Reject changes from",
+                    options=[a for a in revision_authors if a not in accept_authors],
+                    key="reject_authors"
+                )
+
+                if st.button("Resolve Revisions", key="resolve_revisions_btn"):
+                    if not accept_authors and not reject_authors:
+                        st.warning("Please select at least one author to accept or reject.")
+                    else:
+                        processed_data = None
+                        left_tracked = []
+                        mode = check_memory_budget(highlight_source)
+                        if mode == "reject":
+                            st.error(f"This document is too large to process within the {MEMORY_BUDGET_MB} MB memory budget.")
+                        else:
+                            job = start_job('highlight_job', "Resolving revisions...")
+                            try:
+                                with track_memory("resolve_revisions") as memory_stats:
+                                    processed_data = resolve_revisions(
+                                        highlight_source, accept_authors, reject_authors,
+                                        streaming=(mode == "stream"), memory_stats=memory_stats, cancel_token=job,
+                                        left_tracked=left_tracked
+                                    )
+                            finally:
+                                finish_job('highlight_job', job)
+                            if memory_stats is not None:
+                                st.session_state['memory_stats'] = memory_stats
+
+                        if processed_data:
+                            st.session_state['resolved_data'] = _as_download_data(processed_data)
+                            st.session_state['resolved_filename'] = f"resolved_{highlight_file.name}"
+                            st.session_state['resolved_left_tracked'] = left_tracked
+
+                if 'resolved_data' in st.session_state:
+                    st.success("Revisions resolved successfully!")
+                    left_tracked = st.session_state.get('resolved_left_tracked')
+                    if left_tracked:
+                        st.warning(
+                            f"{len(left_tracked)} inserted or deleted paragraph marks / table rows by "
+                            f"{', '.join(sorted(set(left_tracked)))} are still tracked, because resolving them "
+                            "would merge or remove paragraphs or rows. Accept or reject them in Word (Review tab)."
+                        )
+                    st.download_button(
+                        label="Download Resolved Document",
+                        data=st.session_state['resolved_data'],
+                        file_name=st.session_state['resolved_filename'],
+                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                        key="download_resolved"
+                    )
+
     with tab_about:
         st.header("About WordConsolidation")
         st.markdown("""
@@ -500,6 +1706,7 @@ def main():
         - Tracked changes (Revisions)
         - Comments
         - Document Metadata (Creator, Last Modified By)
+        - Embedded Word, Excel and PowerPoint objects
         
         #### 2. Selective Processing 🎯
         You are in control.
@@ -517,10 +1724,11 @@ def main():
         - Upload a document with tracked changes.
         - Select authors and assign Word-standard highlight colors.
         - Additions and deletions by those authors get highlighted.
-        - Color preview swatches help you pick the right color.
+        - Search, page through and bulk-select authors in one editable table, even with hundreds of reviewers.
+        - Accept or reject the tracked text changes by selected authors in one pass (paragraph and row marks that would change the document structure stay tracked, with a warning).
         
         #### 5. Privacy First 🔒
-        - **No Data Retention:** Files are processed entirely in-memory.
+        - **No Data Retention:** Files are processed entirely in-memory (unless the operator enables disk spooling for large uploads, see the README).
         - **Secure:** Your original files are never saved to our servers. once you close the tab, the data is gone.
         
         ---
@@ -538,6 +1746,7 @@ def main():
         1. **Upload** your `.docx` file in the **Highlight Revisions** tab.
         2. **Select authors** and assign colors using the dropdowns.
         3. Click **Apply Highlights** and download the highlighted file.
+        4. (Optional) Under **Resolve Revisions**, choose authors whose changes to accept or reject and download the resolved file.
         
         ---
         *Version 1.2*
@@ -550,5 +1759,18 @@ def main():
         **Disclaimer:** This tool is provided "as is" without warranty of any kind. Users are responsible for verifying the output of processed documents.
         """)
         
+    if memory_panel is not None:
+        with memory_panel.container():
+            with st.expander("Debug: Memory"):
+                st.caption(f"Budget: {MEMORY_BUDGET_MB} MB" if MEMORY_BUDGET_MB else "Budget: unlimited")
+                memory_stats = st.session_state.get('memory_stats')
+                if memory_stats:
+                    st.write(f"**{memory_stats['operation']}** peak: {memory_stats['peak_bytes'] / (1024 * 1024):.2f} MB")
+                    # Largest parts first
+                    top_parts = sorted(memory_stats['parts'].items(), key=lambda kv: kv[1], reverse=True)[:10]
+                    st.table({"Part": [p for p, _ in top_parts], "Peak (KB)": [f"{b / 1024:.1f}" for _, b in top_parts]})
+                else:
+                    st.caption("No operation recorded yet.")
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,236 @@
+"""
+Corpus analytics: who edited what across a directory tree of .docx files.
+
+Scans every document with a process pool (scan only, nothing is rewritten), streams one
+row per document to JSONL or CSV, and writes a compact columnar per-author summary.
+Processed paths are appended to a checkpoint file, so an interrupted run can be resumed
+by running the same command again.
+
+Usage:
+    python corpus_report.py /archive --output report.jsonl
+    python corpus_report.py /archive --output report.csv --workers 8 --summary summary.json
+
+Imports app.py for the extraction logic, so streamlit must be installed.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import zipfile
+from multiprocessing import Pool
+
+import app
+
+CSV_FIELDS = ["path", "author", "insertions", "deletions", "comments", "creator", "last_modified_by", "error"]
+
+def find_documents(root):
+    """Yields .docx paths under root in a stable order, skipping Word lock files (~$name.docx)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith('.docx') and not name.startswith('~$'):
+                yield os.path.join(dirpath, name)
+
+def scan_document(path):
+    """Worker: scans one document through an mmap. Errors are reported in the row, not raised."""
+    row = {"path": path, "revisions": {}, "comments": {}, "creator": [], "last_modified_by": [], "error": None}
+    source = None
+    try:
+        source = app.map_path(path)
+        if source is None:
+            row["error"] = "empty file"
+            return row
+        row.update(app.scan_authorship(source))
+    except zipfile.BadZipFile:
+        row["error"] = "not a valid docx or zip file"
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if source is not None:
+            source.close()
+    return row
+
+def csv_rows(doc):
+    """
+    Flattens a document row to one CSV row per author (one row without author if there are none).
+    The creator and last_modified_by lists are JSON-encoded, since names may contain any separator.
+    """
+    creator = json.dumps(doc["creator"], ensure_ascii=False)
+    last_modified_by = json.dumps(doc["last_modified_by"], ensure_ascii=False)
+    authors = sorted(set(doc["revisions"]) | set(doc["comments"]))
+    for author in authors or [""]:
+        counts = doc["revisions"].get(author, {})
+        yield {
+            "path": doc["path"],
+            "author": author,
+            "insertions": counts.get("insertions", 0),
+            "deletions": counts.get("deletions", 0),
+            "comments": doc["comments"].get(author, 0),
+            "creator": creator,
+            "last_modified_by": last_modified_by,
+            "error": doc["error"] or "",
+        }
+
+def read_documents(output_path, fmt):
+    """
+    Reads the per-document rows back (deduplicated by path, last write wins).
+    Undecodable JSONL lines (a write torn by a crash) are skipped.
+    """
+    docs = {}
+    if not os.path.exists(output_path):
+        return docs
+    with open(output_path, newline='', encoding='utf-8') as f:
+        if fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    try:
+                        doc = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    docs[doc["path"]] = doc
+        else:
+            # Each document's rows are written as one contiguous block; a later block wins
+            previous_path = None
+            for row in csv.DictReader(f):
+                if row["path"] != previous_path:
+                    docs[row["path"]] = {
+                        "path": row["path"], "revisions": {}, "comments": {},
+                        "creator": json.loads(row["creator"]),
+                        "last_modified_by": json.loads(row["last_modified_by"]),
+                        "error": row["error"] or None,
+                    }
+                    previous_path = row["path"]
+                doc = docs[row["path"]]
+                if row["author"]:
+                    doc["revisions"][row["author"]] = {
+                        "insertions": int(row["insertions"]), "deletions": int(row["deletions"]),
+                    }
+                    doc["comments"][row["author"]] = int(row["comments"])
+    return docs
+
+def build_summary(docs):
+    """
+    Aggregates per author across the corpus into a columnar table (one list per column),
+    plus corpus totals.
+    """
+    per_author = {}
+
+    def entry(author):
+        return per_author.setdefault(author, {
+            "documents": set(), "insertions": 0, "deletions": 0, "comments": 0,
+            "creator_of": 0, "last_modified_by_of": 0,
+        })
+
+    for doc in docs.values():
+        for author, counts in doc["revisions"].items():
+            if counts.get("insertions") or counts.get("deletions"):
+                e = entry(author)
+                e["documents"].add(doc["path"])
+                e["insertions"] += counts.get("insertions", 0)
+                e["deletions"] += counts.get("deletions", 0)
+        for author, count in doc["comments"].items():
+            if count:
+                e = entry(author)
+                e["documents"].add(doc["path"])
+                e["comments"] += count
+        for author in doc["creator"]:
+            entry(author)["creator_of"] += 1
+        for author in doc["last_modified_by"]:
+            entry(author)["last_modified_by_of"] += 1
+
+    authors = sorted(per_author)
+    columns = {"author": authors, "documents": [len(per_author[a]["documents"]) for a in authors]}
+    for key in ("insertions", "deletions", "comments", "creator_of", "last_modified_by_of"):
+        columns[key] = [per_author[a][key] for a in authors]
+
+    return {
+        "documents": len(docs),
+        "errors": sum(1 for doc in docs.values() if doc["error"]),
+        "columns": columns,
+    }
+
+def load_checkpoint(checkpoint_path):
+    if not os.path.exists(checkpoint_path):
+        return set()
+    with open(checkpoint_path, encoding='utf-8') as f:
+        return {line.rstrip('\n') for line in f if line.strip()}
+
+def truncate_partial_line(path, terminator):
+    """
+    Cuts a file back to its last complete line, dropping what a crash left half-written.
+    Returns the number of bytes removed.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'r+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = 0
+        # Scan backwards in blocks (overlapping by the terminator length) for the last terminator
+        block_end = size
+        while block_end > 0:
+            start = max(0, block_end - 65536)
+            f.seek(start)
+            index = f.read(block_end - start).rfind(terminator)
+            if index >= 0:
+                end = start + index + len(terminator)
+                break
+            if start == 0:
+                break
+            block_end = start + len(terminator) - 1
+        f.truncate(end)
+    return size - end
+
+def run(root, output_path, fmt, checkpoint_path, summary_path, workers, chunksize=8):
+    # A crash can tear the last output row or checkpoint line; both are redone below.
+    # csv.writer ends rows with \r\n, while a bare \n may occur inside quoted values.
+    truncate_partial_line(output_path, b"\r\n" if fmt == "csv" else b"\n")
+    truncate_partial_line(checkpoint_path, b"\n")
+    done = load_checkpoint(checkpoint_path)
+    pending = [path for path in find_documents(root) if path not in done]
+    print(f"{len(done)} documents already processed, {len(pending)} to scan")
+
+    new_csv = fmt == "csv" and (not os.path.exists(output_path) or os.path.getsize(output_path) == 0)
+    with open(output_path, 'a', newline='', encoding='utf-8') as out, \
+            open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS) if fmt == "csv" else None
+        if new_csv:
+            writer.writeheader()
+
+        with Pool(processes=workers) as pool:
+            for count, doc in enumerate(pool.imap_unordered(scan_document, pending, chunksize), 1):
+                # Output first, then checkpoint: a crash in between only repeats a row
+                if writer:
+                    writer.writerows(csv_rows(doc))
+                else:
+                    out.write(json.dumps(doc, ensure_ascii=False) + "\n")
+                out.flush()
+                checkpoint.write(doc["path"] + "\n")
+                checkpoint.flush()
+                if count % 500 == 0:
+                    print(f"  {count}/{len(pending)}")
+
+    summary = build_summary(read_documents(output_path, fmt))
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"{summary['documents']} documents ({summary['errors']} errors), "
+          f"{len(summary['columns']['author'])} authors; summary written to {summary_path}")
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan a directory tree of .docx files and report authorship.")
+    parser.add_argument("root", help="Directory to scan recursively")
+    parser.add_argument("--output", default="corpus_report.jsonl", help="Per-document rows (.jsonl or .csv)")
+    parser.add_argument("--checkpoint", help="Processed-paths file (default: <output>.checkpoint)")
+    parser.add_argument("--summary", help="Columnar per-author summary (default: <output>.summary.json)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    fmt = "csv" if args.output.lower().endswith(".csv") else "jsonl"
+    checkpoint_path = args.checkpoint or args.output + ".checkpoint"
+    summary_path = args.summary or os.path.splitext(args.output)[0] + ".summary.json"
+    run(args.root, args.output, fmt, checkpoint_path, summary_path, args.workers)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
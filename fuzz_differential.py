@@ -0,0 +1,441 @@
+"""
+Differential fuzz harness for the document transforms.
+
+Generates randomised OOXML packages, runs the reference transforms (frozen copies of the
+original regex logic below) and a candidate engine side by side, diffs outputs and timings,
+and shrinks failing cases to a minimal reproducer.
+
+Usage:
+    python fuzz_differential.py --iterations 200 --seed 1
+    python fuzz_differential.py --candidate app-streaming
+    python fuzz_differential.py --candidate app-mmap
+    python fuzz_differential.py --candidate my_engine   # any module exposing the four functions
+
+The `app` candidates import app.py and therefore need streamlit installed.
+"""
+import argparse
+import importlib
+import io
+import os
+import random
+import re
+import sys
+import time
+import zipfile
+
+OPERATIONS = ["extract_authors", "extract_revision_authors", "process_docx", "apply_author_highlights"]
+
+# ---------------------------------------------------------------------------
+# Reference engine: the original transforms, kept verbatim (minus streamlit error reporting)
+# ---------------------------------------------------------------------------
+
+def reference_extract_revision_authors(uploaded_file):
+    authors = set()
+    pattern_ins_del = re.compile(rb'<w:(ins|del)[^>]*w:author="([^"]*)"[^>]*>')
+    try:
+        with zipfile.ZipFile(uploaded_file, 'r') as zin:
+            for item in zin.infolist():
+                if item.filename.endswith('.xml'):
+                    content = zin.read(item.filename)
+                    for match in pattern_ins_del.finditer(content):
+                        authors.add(match.group(2).decode('utf-8').strip())
+    except Exception:
+        pass
+    return sorted(list(authors))
+
+def reference_extract_authors(uploaded_file):
+    authors = set()
+    pattern_attr_double = re.compile(rb'((?:w|w15):author=")([^"]*)(")')
+    pattern_attr_single = re.compile(rb"((?:w|w15):author=')([^']*)(')")
+    pattern_el_creator = re.compile(rb'(<dc:creator>)(.*?)(</dc:creator>)')
+    pattern_el_lastmod = re.compile(rb'(<cp:lastModifiedBy>)(.*?)(</cp:lastModifiedBy>)')
+    try:
+        with zipfile.ZipFile(uploaded_file, 'r') as zin:
+            for item in zin.infolist():
+                if item.filename.endswith('.xml'):
+                    content = zin.read(item.filename)
+                    for match in pattern_attr_double.finditer(content):
+                        authors.add(match.group(2).decode('utf-8').strip())
+                    for match in pattern_attr_single.finditer(content):
+                        authors.add(match.group(2).decode('utf-8').strip())
+                    for match in pattern_el_creator.finditer(content):
+                        authors.add(match.group(2).decode('utf-8').strip())
+                    for match in pattern_el_lastmod.finditer(content):
+                        authors.add(match.group(2).decode('utf-8').strip())
+    except Exception:
+        pass
+    return sorted(list(authors))
+
+def reference_process_docx(uploaded_file, target_authors, new_author_name, new_initials, remove_highlights=False):
+    output_buffer = io.BytesIO()
+    pattern_initials_double = re.compile(rb'(w:initials=")([^"]*)(")')
+    pattern_initials_single = re.compile(rb"(w:initials=')([^']*)(')")
+    pattern_highlight = re.compile(rb'(<w(?:15)?:highlight[^>]*/>)')
+    new_author_bytes = new_author_name.encode('utf-8')
+    new_initials_bytes = new_initials.encode('utf-8')
+
+    with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                content = zin.read(item.filename)
+                if item.filename.endswith('.xml') and item.filename != 'word/people.xml':
+                    if remove_highlights:
+                        content = pattern_highlight.sub(rb'', content)
+                    if target_authors:
+                        for author in target_authors:
+                            author_bytes = author.encode('utf-8')
+                            if author_bytes in content:
+                                content = content.replace(author_bytes, new_author_bytes)
+                        content = pattern_initials_double.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
+                        content = pattern_initials_single.sub(rb'\g<1>' + new_initials_bytes + rb'\g<3>', content)
+                zout.writestr(item, content)
+    return output_buffer.getvalue()
+
+def reference_apply_author_highlights(uploaded_file, author_colors):
+    output_buffer = io.BytesIO()
+    with zipfile.ZipFile(uploaded_file, 'r') as zin:
+        with zipfile.ZipFile(output_buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                content = zin.read(item.filename)
+                if item.filename.endswith('.xml') and item.filename != 'word/people.xml':
+                    for author, color in author_colors.items():
+                        author_bytes = author.encode('utf-8')
+                        highlight_tag = f'<w:highlight w:val="{color}"/>'.encode('utf-8')
+                        ins_pattern = re.compile(
+                            rb'(<w:ins[^>]*w:author="' + re.escape(author_bytes) + rb'"[^>]*>)(.*?)(</w:ins>)',
+                            re.DOTALL
+                        )
+                        del_pattern = re.compile(
+                            rb'(<w:del[^>]*w:author="' + re.escape(author_bytes) + rb'"[^>]*>)(.*?)(</w:del>)',
+                            re.DOTALL
+                        )
+
+                        def add_highlight_to_runs(m, highlight_tag=highlight_tag):
+                            def process_run(run_match):
+                                run_content = run_match.group(0)
+                                run_content = re.sub(rb'<w:highlight[^>]*/>', b'', run_content)
+                                if b'<w:rPr>' in run_content:
+                                    run_content = run_content.replace(b'<w:rPr>', b'<w:rPr>' + highlight_tag, 1)
+                                elif b'<w:rPr ' in run_content:
+                                    run_content = re.sub(rb'(<w:rPr[^>]*>)', rb'\1' + highlight_tag, run_content, count=1)
+                                else:
+                                    run_content = re.sub(
+                                        rb'(<w:r(?:\s[^>]*)?>)',
+                                        rb'\1<w:rPr>' + highlight_tag + rb'</w:rPr>',
+                                        run_content,
+                                        count=1
+                                    )
+                                return run_content
+                            inner = re.sub(rb'<w:r(?:\s[^>]*)?>.*?</w:r>', process_run, m.group(2), flags=re.DOTALL)
+                            return m.group(1) + inner + m.group(3)
+
+                        content = ins_pattern.sub(add_highlight_to_runs, content)
+                        content = del_pattern.sub(add_highlight_to_runs, content)
+                zout.writestr(item, content)
+    return output_buffer.getvalue()
+
+REFERENCE_ENGINE = {
+    "extract_authors": reference_extract_authors,
+    "extract_revision_authors": reference_extract_revision_authors,
+    "process_docx": reference_process_docx,
+    "apply_author_highlights": reference_apply_author_highlights,
+}
+
+def load_engine(name):
+    """
+    Returns a dict of operation name -> callable for a candidate engine.
+    "app", "app-streaming" and "app-mmap" use app.py (in-memory, streaming and mmap input paths);
+    anything else is imported as a module exposing the four operations under their usual names.
+    """
+    if name in ("app", "app-streaming", "app-mmap"):
+        module = importlib.import_module("app")
+        engine = {op: getattr(module, op) for op in OPERATIONS}
+        if name == "app-streaming":
+            engine["process_docx"] = lambda f, *a, **kw: module.process_docx(f, *a, streaming=True, **kw)
+            engine["apply_author_highlights"] = lambda f, *a, **kw: module.apply_author_highlights(f, *a, streaming=True, **kw)
+        elif name == "app-mmap":
+            engine = {op: (lambda f, *a, fn=fn, **kw: fn(module.spool_to_mmap(f), *a, **kw)) for op, fn in engine.items()}
+        return engine
+
+    module = importlib.import_module(name)
+    return {op: getattr(module, op) for op in OPERATIONS}
+
+# ---------------------------------------------------------------------------
+# Case generation
+# ---------------------------------------------------------------------------
+
+# Multi-byte names, punctuation and case/whitespace variants of the same person
+AUTHOR_POOL = [
+    "Alice", "alice", "Alice ", "Bob", "Zhang, Lin", "zhang, lin", "Müller", "张伟", "José Ñúñez",
+    "O'Brien", "R&amp;D Team", "Σοφία", "👩‍💻 Dev", "BR/TSD/FMD",
+]
+
+RPR_VARIANTS = [
+    b"", b"<w:rPr/>", b"<w:rPr></w:rPr>", b"<w:rPr><w:b/></w:rPr>",
+    b'<w:rPr w:rsidR="00AB12CD"><w:i/></w:rPr>', b'<w:rPr><w:highlight w:val="green"/></w:rPr>',
+    b'<w:rPr><w15:highlight w15:val="red"/><w:u w:val="single"/></w:rPr>',
+]
+
+PART_SKELETONS = {
+    "word/document.xml": (b'<?xml version="1.0" encoding="UTF-8"?><w:document><w:body>', b'</w:body></w:document>'),
+    "word/comments.xml": (b'<?xml version="1.0" encoding="UTF-8"?><w:comments>', b'</w:comments>'),
+    "word/footer1.xml": (b'<?xml version="1.0" encoding="UTF-8"?><w:ftr>', b'</w:ftr>'),
+    "word/people.xml": (b'<?xml version="1.0" encoding="UTF-8"?><w15:people>', b'</w15:people>'),
+    "docProps/core.xml": (b'<?xml version="1.0" encoding="UTF-8"?><cp:coreProperties>', b'</cp:coreProperties>'),
+}
+
+def _author_attr(rng, author, prefixes=(b"w",)):
+    """Renders an author attribute with a random prefix and quote style valid for the name."""
+    prefix = rng.choice(prefixes)
+    quote = b'"' if "'" in author or rng.random() < 0.7 else b"'"
+    return prefix + b":author=" + quote + author.encode("utf-8") + quote
+
+def _run(rng, text_tag=b"w:t"):
+    r_open = rng.choice([b"<w:r>", b'<w:r w:rsidR="00112233">', b"<w:r w:rsidRPr='0044'>"])
+    text = rng.choice(["text", "more text", "ünïcödé", "文本", "a b  c", ""]).encode("utf-8")
+    return r_open + rng.choice(RPR_VARIANTS) + b"<" + text_tag + b">" + text + b"</" + text_tag + b"></w:r>"
+
+def _revision(rng, depth=0):
+    kind = rng.choice([b"ins", b"del"])
+    author = rng.choice(AUTHOR_POOL)
+    opening = b"<w:" + kind + b' w:id="' + str(rng.randrange(1000)).encode() + b'" ' + \
+        _author_attr(rng, author, (b"w", b"w", b"w15")) + b' w:date="2024-01-01T00:00:00Z">'
+    text_tag = b"w:delText" if kind == b"del" else b"w:t"
+    inner = [_run(rng, text_tag) for _ in range(rng.randrange(0, 4))]
+    # Nested revisions (e.g. a deletion inside someone else's insertion)
+    if depth < 2 and rng.random() < 0.2:
+        inner.insert(rng.randrange(len(inner) + 1), _revision(rng, depth + 1))
+    return opening + b"".join(inner) + b"</w:" + kind + b">"
+
+def _paragraph(rng):
+    pieces = []
+    for _ in range(rng.randrange(1, 6)):
+        pieces.append(_revision(rng) if rng.random() < 0.5 else _run(rng))
+    return b"<w:p>" + b"".join(pieces) + b"</w:p>"
+
+def _comment(rng, idx):
+    author = rng.choice(AUTHOR_POOL)
+    initials = rng.choice(["AB", "ZL", "张", "X"]).encode("utf-8")
+    quote = b'"' if rng.random() < 0.7 else b"'"
+    return (b'<w:comment w:id="' + str(idx).encode() + b'" ' + _author_attr(rng, author, (b"w",)) +
+            b" w:initials=" + quote + initials + quote + b">" + _paragraph(rng) + b"</w:comment>")
+
+def generate_case(rng, huge_probability=0.05):
+    """
+    Returns a case dict: XML parts as lists of fragments (so they can be shrunk),
+    a binary media member, the package compression and randomised operation parameters.
+    Stored (uncompressed) packages exercise the zero-copy reads of the mmap path.
+    """
+    paragraphs = [_paragraph(rng) for _ in range(rng.randrange(1, 20))]
+    if rng.random() < huge_probability:
+        # Huge part: many copies of a few paragraphs
+        paragraphs = paragraphs * (20000 // len(paragraphs))
+
+    parts = {
+        "word/document.xml": paragraphs,
+        "word/comments.xml": [_comment(rng, i) for i in range(rng.randrange(0, 5))],
+        "word/footer1.xml": [b"<w:p><w:r><w:t>" + rng.choice(AUTHOR_POOL).encode("utf-8") + b"</w:t></w:r></w:p>"],
+        "word/people.xml": [b"<w15:person " + _author_attr(rng, a, (b"w15",)) + b"/>" for a in rng.sample(AUTHOR_POOL, 3)],
+        "docProps/core.xml": [
+            b"<dc:creator>" + rng.choice(AUTHOR_POOL).encode("utf-8") + b"</dc:creator>",
+            b"<cp:lastModifiedBy>" + rng.choice(AUTHOR_POOL).encode("utf-8") + b"</cp:lastModifiedBy>",
+        ],
+    }
+    authors = rng.sample(AUTHOR_POOL, rng.randrange(0, 5))
+    params = {
+        "target_authors": authors,
+        "new_author_name": rng.choice(["BR/TSD/FMD", "Reviewer", "审阅者"]),
+        "new_initials": rng.choice(["FMD", "R", "审"]),
+        "remove_highlights": rng.random() < 0.5,
+        "author_colors": {a: rng.choice(["yellow", "green", "darkBlue"]) for a in rng.sample(AUTHOR_POOL, rng.randrange(1, 4))},
+    }
+    binary = {"word/media/image1.png": rng.randbytes(rng.randrange(0, 2048))}
+    compression = rng.choice([zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+    return {"parts": parts, "binary": binary, "compression": compression, "params": params}
+
+def render_case(case):
+    """Builds the docx bytes for a case."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', case.get("compression", zipfile.ZIP_DEFLATED)) as z:
+        for name, fragments in case["parts"].items():
+            prefix, suffix = PART_SKELETONS[name]
+            z.writestr(name, prefix + b"".join(fragments) + suffix)
+        for name, data in case["binary"].items():
+            z.writestr(name, data)
+    return buffer.getvalue()
+
+# ---------------------------------------------------------------------------
+# Running and diffing
+# ---------------------------------------------------------------------------
+
+def _call(engine, op, docx_bytes, params):
+    f = io.BytesIO(docx_bytes)
+    if op == "process_docx":
+        return engine[op](f, params["target_authors"], params["new_author_name"], params["new_initials"],
+                          remove_highlights=params["remove_highlights"])
+    if op == "apply_author_highlights":
+        return engine[op](f, params["author_colors"])
+    return engine[op](f)
+
+def normalise(result):
+    """Makes results comparable: zip outputs become ordered (name, content) lists; errors collapse to one value."""
+    if result is None:
+        return ("error",)
+    if hasattr(result, "read"):
+        result = result.read()
+    if isinstance(result, bytes):
+        with zipfile.ZipFile(io.BytesIO(result)) as z:
+            return [(i.filename, z.read(i.filename)) for i in z.infolist()]
+    return result
+
+def run_op(engine, op, docx_bytes, params):
+    """Returns (normalised result, seconds)."""
+    start = time.perf_counter()
+    try:
+        result = _call(engine, op, docx_bytes, params)
+    except Exception:
+        result = None
+    elapsed = time.perf_counter() - start
+    return normalise(result), elapsed
+
+def case_fails(case, op, candidate):
+    docx_bytes = render_case(case)
+    expected, _ = run_op(REFERENCE_ENGINE, op, docx_bytes, case["params"])
+    actual, _ = run_op(candidate, op, docx_bytes, case["params"])
+    return expected != actual
+
+def describe_diff(expected, actual):
+    """One-line summary of where two normalised results first differ."""
+    if not isinstance(expected, list) or not isinstance(actual, list) or not expected or not isinstance(expected[0], tuple):
+        return f"expected {expected!r}, got {actual!r}"
+    for (e_name, e_data), (a_name, a_data) in zip(expected, actual):
+        if e_name != a_name:
+            return f"member order differs: {e_name} vs {a_name}"
+        if e_data != a_data:
+            at = next(i for i in range(min(len(e_data), len(a_data)) + 1)
+                      if i >= len(e_data) or i >= len(a_data) or e_data[i] != a_data[i])
+            return (f"{e_name} differs at byte {at}: expected {e_data[max(0, at - 40):at + 40]!r}, "
+                    f"got {a_data[max(0, at - 40):at + 40]!r}")
+    return f"member count differs: {len(expected)} vs {len(actual)}"
+
+# ---------------------------------------------------------------------------
+# Shrinking
+# ---------------------------------------------------------------------------
+
+def _shrink_list(items, still_fails):
+    """Delta-debugging style reduction: drop chunks, then single items, while the failure persists."""
+    chunk = max(1, len(items) // 2)
+    while chunk >= 1:
+        i = 0
+        while i < len(items):
+            candidate = items[:i] + items[i + chunk:]
+            if still_fails(candidate):
+                items = candidate
+            else:
+                i += chunk
+        if chunk == 1:
+            break
+        chunk //= 2
+    return items
+
+def shrink_case(case, op, candidate):
+    """Reduces a failing case to a minimal reproducer (parts, fragments, media, parameters)."""
+    case = {**case, "parts": dict(case["parts"]), "binary": dict(case["binary"]), "params": dict(case["params"])}
+
+    def with_parts(parts):
+        return {**case, "parts": parts}
+
+    # Whole parts first
+    names = _shrink_list(list(case["parts"]),
+                         lambda keep: case_fails(with_parts({n: case["parts"][n] for n in keep}), op, candidate))
+    case["parts"] = {n: case["parts"][n] for n in names}
+
+    # Media
+    if case["binary"] and case_fails({**case, "binary": {}}, op, candidate):
+        case["binary"] = {}
+
+    # Fragments within each remaining part (duplicates from huge parts collapse here too)
+    for name in list(case["parts"]):
+        case["parts"][name] = _shrink_list(
+            case["parts"][name],
+            lambda frags, name=name: case_fails(with_parts({**case["parts"], name: frags}), op, candidate)
+        )
+
+    # Operation parameters
+    for key in ("target_authors",):
+        case["params"][key] = _shrink_list(
+            case["params"][key],
+            lambda vals, key=key: case_fails({**case, "params": {**case["params"], key: vals}}, op, candidate)
+        )
+    colors = _shrink_list(
+        list(case["params"]["author_colors"].items()),
+        lambda items: case_fails({**case, "params": {**case["params"], "author_colors": dict(items)}}, op, candidate)
+    )
+    case["params"]["author_colors"] = dict(colors)
+    return case
+
+def save_reproducer(case, op, seed, out_dir):
+    """Writes the minimal docx and a text description; returns the docx path."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{op}_seed{seed}.docx")
+    with open(path, "wb") as f:
+        f.write(render_case(case))
+    with open(path[:-len(".docx")] + ".txt", "w", encoding="utf-8") as f:
+        f.write(f"operation: {op}\ncompression: {case.get('compression', zipfile.ZIP_DEFLATED)}\nparams: {case['params']!r}\n")
+        for name, fragments in case["parts"].items():
+            f.write(f"\n--- {name}\n")
+            for fragment in fragments:
+                f.write(fragment.decode("utf-8", "replace") + "\n")
+    return path
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def run(iterations, seed, candidate_name, ops, out_dir, shrink=True):
+    candidate = load_engine(candidate_name)
+    timings = {op: [0.0, 0.0] for op in ops}
+    failures = 0
+
+    for i in range(iterations):
+        case_seed = seed + i
+        rng = random.Random(case_seed)
+        case = generate_case(rng)
+        docx_bytes = render_case(case)
+
+        for op in ops:
+            expected, t_ref = run_op(REFERENCE_ENGINE, op, docx_bytes, case["params"])
+            actual, t_cand = run_op(candidate, op, docx_bytes, case["params"])
+            timings[op][0] += t_ref
+            timings[op][1] += t_cand
+
+            if expected != actual:
+                failures += 1
+                print(f"MISMATCH {op} (seed {case_seed}): {describe_diff(expected, actual)}")
+                if shrink:
+                    minimal = shrink_case(case, op, candidate)
+                    path = save_reproducer(minimal, op, case_seed, out_dir)
+                    print(f"  minimal reproducer: {path}")
+
+    print(f"\n{iterations} cases, {failures} mismatches (candidate: {candidate_name})")
+    print(f"{'operation':<26}{'reference s':>12}{'candidate s':>13}{'speedup':>9}")
+    for op, (t_ref, t_cand) in timings.items():
+        speedup = t_ref / t_cand if t_cand else float("inf")
+        print(f"{op:<26}{t_ref:>12.3f}{t_cand:>13.3f}{speedup:>8.2f}x")
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential fuzzing of docx transforms against the reference engine.")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--candidate", default="app", help='"app", "app-streaming", "app-mmap" or an importable module name')
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument("--out-dir", default="fuzz_failures", help="Where minimal reproducers are written")
+    parser.add_argument("--no-shrink", action="store_true")
+    args = parser.parse_args(argv)
+
+    failures = run(args.iterations, args.seed, args.candidate, args.ops, args.out_dir, shrink=not args.no_shrink)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
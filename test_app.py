@@ -0,0 +1,457 @@
+import io
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+import zipfile
+import unittest
+from unittest.mock import patch
+
+# app.py imports streamlit (and pandas) at module level. Tests only exercise the processing
+# functions, so minimal stand-ins are installed when the UI dependencies are not available.
+for _module in ("streamlit", "pandas"):
+    try:
+        __import__(_module)
+    except ImportError:
+        sys.modules[_module] = types.ModuleType(_module)
+
+import app
+
+
+def make_package(members, compression=zipfile.ZIP_DEFLATED):
+    """Builds a zip package in memory from {name: bytes}."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+class TestApp(unittest.TestCase):
+    def test_resolve_revisions(self):
+        """Test accepting/rejecting tracked changes by author"""
+        xml_content = (
+            b'<w:p>'
+            b'<w:ins w:id="1" w:author="Alice"><w:r><w:t>Added by Alice</w:t></w:r></w:ins>'
+            b'<w:del w:id="2" w:author="Bob"><w:r><w:delText xml:space="preserve">Deleted by Bob</w:delText></w:r></w:del>'
+            b'<w:ins w:id="3" w:author="Carol"><w:r><w:t>Added by Carol</w:t></w:r></w:ins>'
+            b'<w:del w:id="4" w:author="Alice"><w:r><w:delText>Deleted by Alice</w:delText></w:r></w:del>'
+            b'</w:p>'
+        )
+
+        # Accept Alice, reject Bob, leave Carol tracked
+        resolved = app.resolve_revisions_part(xml_content, ["Alice"], ["Bob"])
+
+        # Alice's insertion is unwrapped, her deletion dropped
+        self.assertIn(b'<w:r><w:t>Added by Alice</w:t></w:r>', resolved)
+        self.assertNotIn(b'Deleted by Alice', resolved)
+        self.assertNotIn(b'w:author="Alice"', resolved)
+
+        # Bob's deletion is restored as regular text
+        self.assertIn(b'<w:t xml:space="preserve">Deleted by Bob</w:t>', resolved)
+        self.assertNotIn(b'w:delText xml:space="preserve">Deleted by Bob', resolved)
+
+        # Carol's insertion is untouched
+        self.assertIn(b'<w:ins w:id="3" w:author="Carol"><w:r><w:t>Added by Carol</w:t></w:r></w:ins>', resolved)
+
+        # Rejecting Alice drops her insertion and restores her deletion
+        resolved = app.resolve_revisions_part(xml_content, [], ["Alice"])
+        self.assertNotIn(b'Added by Alice', resolved)
+        self.assertIn(b'<w:r><w:t>Deleted by Alice</w:t></w:r>', resolved)
+
+        print("Test passed: Revisions resolved by author successfully.")
+
+    def test_resolve_structural_markers(self):
+        """Test that paragraph/row marks needing a structural change are reported as still tracked"""
+        xml_content = (
+            b'<w:p><w:pPr><w:rPr><w:ins w:id="1" w:author="Alice"/></w:rPr></w:pPr></w:p>'
+            b'<w:p><w:pPr><w:rPr><w:del w:id="2" w:author="Alice"/></w:rPr></w:pPr></w:p>'
+            b'<w:tr><w:trPr><w:ins w:id="3" w:author="Bob"/></w:trPr></w:tr>'
+            b'<w:p><w:pPr><w:rPr><w:del w:id="4" w:author="Carol"/></w:rPr></w:pPr></w:p>'
+        )
+
+        left_tracked = []
+        resolved = app.resolve_revisions_part(xml_content, ["Alice"], ["Bob"], left_tracked=left_tracked)
+        # Alice's inserted mark is accepted; her deleted mark and Bob's rejected row stay tracked
+        self.assertNotIn(b'w:id="1"', resolved)
+        self.assertIn(b'<w:del w:id="2" w:author="Alice"/>', resolved)
+        self.assertIn(b'<w:ins w:id="3" w:author="Bob"/>', resolved)
+        self.assertEqual(left_tracked, ["Alice", "Bob"])
+
+        package = make_package({'word/document.xml': b'<w:body>' + xml_content + b'</w:body>'})
+        left_tracked = []
+        result = app.resolve_revisions(package, ["Alice"], ["Bob"], left_tracked=left_tracked)
+        self.assertEqual(left_tracked, ["Alice", "Bob"])
+        self.assertEqual(app.extract_revision_authors(io.BytesIO(result)), ["Alice", "Bob", "Carol"])
+        print("Test passed: Structural markers left tracked are reported.")
+
+    def test_resolve_move_ranges(self):
+        """Test that resolving a move removes its range markers"""
+        xml_content = (
+            b'<w:body>'
+            b'<w:p><w:moveFromRangeStart w:id="10" w:author="Alice" w:name="move1"/>'
+            b'<w:moveFrom w:id="11" w:author="Alice"><w:r><w:t>Moved</w:t></w:r></w:moveFrom>'
+            b'<w:moveFromRangeEnd w:id="10"/></w:p>'
+            b'<w:p><w:moveToRangeStart w:id="12" w:author="Alice" w:name="move1"/>'
+            b'<w:moveTo w:id="13" w:author="Alice"><w:r><w:t>Moved</w:t></w:r></w:moveTo>'
+            b'<w:moveToRangeEnd w:id="12"/></w:p>'
+            b'<w:p><w:moveToRangeStart w:id="20" w:author="Carol" w:name="move2"/>'
+            b'<w:moveTo w:id="21" w:author="Carol"><w:r><w:t>Kept</w:t></w:r></w:moveTo>'
+            b'<w:moveToRangeEnd w:id="20"/></w:p>'
+            b'</w:body>'
+        )
+
+        for accept, reject in ((["Alice"], []), ([], ["Alice"])):
+            resolved = app.resolve_revisions_part(xml_content, accept, reject)
+            self.assertNotIn(b'w:id="10"', resolved)
+            self.assertNotIn(b'w:id="12"', resolved)
+            self.assertEqual(resolved.count(b'<w:t>Moved</w:t>'), 1)
+            # Carol's move is still tracked, markers included
+            self.assertIn(b'<w:moveToRangeStart w:id="20" w:author="Carol" w:name="move2"/>', resolved)
+            self.assertIn(b'<w:moveToRangeEnd w:id="20"/>', resolved)
+
+        print("Test passed: Move range markers removed with resolved moves.")
+
+    def test_author_filter_and_pagination(self):
+        """Test searching and paging the author selection table"""
+        authors = [f"Author {i:03d}" for i in range(300)] + ["Zhang, Lin", "zhang, lin "]
+
+        # Case-insensitive search, whitespace in the query ignored
+        self.assertEqual(app.filter_authors(authors, "  ZHANG "), ["Zhang, Lin", "zhang, lin "])
+        self.assertEqual(len(app.filter_authors(authors, "")), 302)
+
+        # Pages are 1-based and clamped to the last page
+        self.assertEqual(app.paginate(authors, 1, 50), authors[:50])
+        self.assertEqual(app.paginate(authors, 7, 50), authors[300:])
+        self.assertEqual(app.paginate(authors, 99, 50), authors[300:])
+
+        print("Test passed: Author filtering and pagination work.")
+
+    def test_probe_docx(self):
+        """Test central-directory validation and summary"""
+        input_buffer = io.BytesIO()
+        with zipfile.ZipFile(input_buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('[Content_Types].xml', b'<Types/>')
+            z.writestr('word/document.xml', b'<w:document>' + b'<w:p/>' * 1000 + b'</w:document>')
+            z.writestr('word/media/image.png', b'fakeimagecontent')
+        input_buffer.seek(0)
+
+        probe = app.probe_docx(input_buffer)
+        self.assertTrue(probe["valid"])
+        self.assertEqual(probe["member_count"], 3)
+        self.assertEqual(probe["largest_parts"][0][0], 'word/document.xml')
+        self.assertEqual(input_buffer.tell(), 0)
+
+        # Not a zip at all
+        probe = app.probe_docx(io.BytesIO(b'not a docx'))
+        self.assertFalse(probe["valid"])
+
+        # A zip that is not a Word document
+        other_buffer = io.BytesIO()
+        with zipfile.ZipFile(other_buffer, 'w') as z:
+            z.writestr('xl/workbook.xml', b'<workbook/>')
+        probe = app.probe_docx(other_buffer)
+        self.assertFalse(probe["valid"])
+        self.assertIn('word/*.xml', probe["error"])
+
+        # The main part does not have to be word/document.xml
+        renamed_buffer = io.BytesIO()
+        with zipfile.ZipFile(renamed_buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('[Content_Types].xml', b'<Types/>')
+            z.writestr('_rels/.rels', b'<Relationships><Relationship Target="word/document2.xml"/></Relationships>')
+            z.writestr('word/document2.xml', b'<w:document><w:ins w:author="Alice"/></w:document>')
+        probe = app.probe_docx(renamed_buffer)
+        self.assertTrue(probe["valid"], probe["error"])
+
+        print("Test passed: Probe validates packages from the central directory.")
+
+    def test_scan_authorship(self):
+        """Test per-author revision and comment counts used by the corpus report"""
+        input_buffer = io.BytesIO()
+        with zipfile.ZipFile(input_buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('word/document.xml', b'<w:document><w:p>'
+                       b'<w:ins w:id="1" w:author="Alice"><w:r><w:t>a</w:t></w:r></w:ins>'
+                       b'<w:ins w:id="2" w:author="Alice "><w:r><w:t>b</w:t></w:r></w:ins>'
+                       b'<w:del w:id="3" w:author="Bob"><w:r><w:delText>c</w:delText></w:r></w:del>'
+                       b'</w:p></w:document>')
+            z.writestr('word/comments.xml', b"<w:comments><w:comment w:id='0' w:author='Carol' w:initials='C'/>"
+                       b'<w:comment w:id="1" w:author="Carol" w:initials="C"/></w:comments>')
+            z.writestr('docProps/core.xml', b'<cp:coreProperties><dc:creator>Dave</dc:creator>'
+                       b'<cp:lastModifiedBy>Bob</cp:lastModifiedBy></cp:coreProperties>')
+        input_buffer.seek(0)
+
+        report = app.scan_authorship(input_buffer)
+        self.assertEqual(report["revisions"]["Alice"], {"insertions": 2, "deletions": 0})
+        self.assertEqual(report["revisions"]["Bob"], {"insertions": 0, "deletions": 1})
+        self.assertEqual(report["comments"], {"Carol": 2})
+        self.assertEqual(report["creator"], ["Dave"])
+        self.assertEqual(report["last_modified_by"], ["Bob"])
+
+        print("Test passed: Authorship scanned successfully.")
+
+    def test_cancel_token(self):
+        """Test cooperative cancellation and wall-clock timeouts"""
+        progress_seen = []
+        token = app.CancelToken(on_check=progress_seen.append, check_interval=0)
+        token.check(0.5)
+        self.assertEqual(progress_seen, [0.5])
+
+        # Cancelled tokens raise at the next checkpoint
+        token.cancel("a new file was uploaded")
+        with self.assertRaises(app.OperationCancelled) as ctx:
+            token.check()
+        self.assertIn("new file", str(ctx.exception))
+
+        # Timeouts raise the more specific exception
+        token = app.CancelToken(timeout=0.001)
+        time.sleep(0.01)
+        with self.assertRaises(app.OperationTimedOut):
+            token.check()
+        self.assertTrue(token.cancelled)
+
+        print("Test passed: Cancellation and timeouts work.")
+
+    def test_progress_within_part(self):
+        """Test that checks inside a part report progress and can stop it"""
+        xml_content = b'<w:p>' + b'<w:ins w:author="Alice"><w:r><w:t>x</w:t></w:r></w:ins>' * 100 + b'</w:p>'
+
+        progress_seen = []
+        token = app.CancelToken(on_check=progress_seen.append, check_interval=0)
+        token.enter_part(1, 2)
+        app.resolve_revisions_part(xml_content, ["Alice"], [], cancel_token=token, check_every=10)
+        # The part's share of the bar is [0.5, 1.0], filled as the token loop advances
+        self.assertEqual(progress_seen[0], 0.5)
+        self.assertEqual(len(progress_seen), 1 + 20)
+        self.assertTrue(all(0.5 < p < 1.0 for p in progress_seen[1:]))
+        self.assertEqual(progress_seen[1:], sorted(progress_seen[1:]))
+
+        # A run stopped from the progress hook stops mid-part
+        def stop(progress):
+            token.cancel("superseded by a new operation")
+
+        token = app.CancelToken(on_check=stop, check_interval=0)
+        with self.assertRaises(app.OperationCancelled):
+            app.resolve_revisions_part(xml_content, ["Alice"], [], cancel_token=token, check_every=10)
+        print("Test passed: Progress within a part")
+
+    def test_fetch_revisions_pages(self):
+        """Test cursor-based paging and filtering of the revision browser"""
+        input_buffer = io.BytesIO()
+        with zipfile.ZipFile(input_buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+            body = b''.join(
+                b'<w:p><w:ins w:id="%d" w:author="%s" w:date="2024-01-01T00:00:00Z"><w:r><w:t>ins %d &amp; more &#8217;&#x2019;&apos;</w:t></w:r></w:ins>'
+                b'<w:del w:id="%d" w:author="Bob"><w:r><w:delText>del %d</w:delText></w:r></w:del></w:p>'
+                % (i, b'Alice' if i % 2 else b'Carol', i, i + 100, i)
+                for i in range(10)
+            )
+            z.writestr('word/document.xml', b'<w:document><w:body>' + body + b'</w:body></w:document>')
+            z.writestr('word/footer1.xml', b'<w:ftr><w:ins w:id="200" w:author="Alice"><w:r><w:t>footer</w:t></w:r></w:ins></w:ftr>')
+        input_buffer.seek(0)
+
+        # Walk every page; nothing is lost or repeated across page and part boundaries
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = app.fetch_revisions(input_buffer, cursor, limit=3)
+            self.assertLessEqual(len(rows), 3)
+            seen.extend(rows)
+            if cursor is None:
+                break
+        self.assertEqual(len(seen), 21)
+        self.assertEqual(seen[0]["Text"], "ins 0 & more \u2019\u2019'")
+        self.assertEqual(seen[-1]["Part"], 'word/footer1.xml')
+
+        # Filters by author and type
+        rows, cursor = app.fetch_revisions(input_buffer, None, limit=50, authors=["Alice"], kinds=["ins"])
+        self.assertIsNone(cursor)
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(all(r["Author"] == "Alice" and r["Type"] == "Insertion" for r in rows))
+
+        # Small chunks split tags and blocks across reads; pages and cursors are unchanged
+        for chunk_size in (1, 7, 64):
+            cursor, chunked = None, []
+            while True:
+                rows, cursor = app.fetch_revisions(input_buffer, cursor, limit=3, chunk_size=chunk_size)
+                chunked.extend(rows)
+                if cursor is None:
+                    break
+            self.assertEqual(chunked, seen)
+
+        # A full first page stops reading early instead of inflating the whole part
+        large = make_package({'word/document.xml': body + b'<w:p/>' * 2000000})
+        bytes_read = []
+        original_read = zipfile.ZipExtFile.read
+
+        def counting_read(stream, n=-1):
+            data = original_read(stream, n)
+            bytes_read.append(len(data))
+            return data
+
+        with patch.object(zipfile.ZipExtFile, 'read', counting_read):
+            rows, cursor = app.fetch_revisions(large, None, limit=5, chunk_size=4096)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(cursor[0], 0)
+        self.assertLess(sum(bytes_read), 64 * 1024)
+
+        print("Test passed: Revision browser pages and filters correctly.")
+
+    def test_sanitize_embedded_packages(self):
+        """Test recursive sanitization of embedded Office packages"""
+        nested_docx = make_package({'word/comments.xml': b'<w:comment w:author="Old Author" w:initials="OA"/>'}).getvalue()
+        workbook = make_package({
+            'xl/comments1.xml': b'<authors><author>Old Author</author></authors>',
+            'xl/embeddings/Nested.docx': nested_docx,
+        }).getvalue()
+        clean_workbook = make_package({'xl/worksheets/sheet1.xml': b'<sheetData/>'}).getvalue()
+
+        result = app._sanitize_embedding(workbook, ["Old Author"], b"NewName", b"NN", False, 1)
+        with zipfile.ZipFile(io.BytesIO(result)) as z:
+            self.assertEqual(z.read('xl/comments1.xml'), b'<authors><author>NewName</author></authors>')
+            with zipfile.ZipFile(io.BytesIO(z.read('xl/embeddings/Nested.docx'))) as nested:
+                self.assertEqual(nested.read('word/comments.xml'), b'<w:comment w:author="NewName" w:initials="NN"/>')
+
+        # Packages without matches and non-zip "packages" pass through byte-for-byte
+        self.assertIs(app._sanitize_embedding(clean_workbook, ["Old Author"], b"NewName", b"NN", False, 1), clean_workbook)
+        self.assertEqual(app._sanitize_embedding(b'not a zip', ["Old Author"], b"NewName", b"NN", False, 1), b'not a zip')
+
+        print("Test passed: Embedded packages sanitized recursively.")
+
+    def test_embedding_limits_and_raw_copy(self):
+        """Test that skipped embeddings are reported and unchanged ones keep their compressed bytes"""
+        def raw_member(package, name):
+            with zipfile.ZipFile(package) as z:
+                info = z.getinfo(name)
+            data = package.getvalue()
+            header = app.ZIP_LOCAL_HEADER.unpack_from(data, info.header_offset)
+            start = info.header_offset + app.ZIP_LOCAL_HEADER.size + header[9] + header[10]
+            return info.compress_type, data[start:start + info.compress_size]
+
+        nested_docx = make_package({'word/comments.xml': b'<w:comment w:author="Old Author"/>'}).getvalue()
+        deep_workbook = make_package({
+            'xl/comments1.xml': b'<authors><author>Old Author</author></authors>',
+            'xl/media/image1.png': bytes(range(256)) * 8,
+            'xl/embeddings/Nested.docx': nested_docx,
+        }).getvalue()
+        big_docx = make_package({
+            'word/comments.xml': b'<w:comment w:author="Old Author"/>',
+            'word/media/image1.png': random.Random(0).randbytes(1536 * 1024),
+        }, zipfile.ZIP_STORED).getvalue()
+        clean_workbook = make_package({'xl/worksheets/sheet1.xml': b'<sheetData/>'}).getvalue()
+
+        package = io.BytesIO()
+        with zipfile.ZipFile(package, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('word/document.xml', b'<w:ins w:author="Old Author"/>')
+            z.writestr('word/embeddings/clean.xlsx', clean_workbook, compress_type=zipfile.ZIP_STORED)
+            z.writestr('word/embeddings/big.docx', big_docx)
+            z.writestr('word/embeddings/deep.xlsx', deep_workbook)
+        package.seek(0)
+
+        with patch.object(app, "EMBEDDING_MAX_MB", 1), patch.object(app, "EMBEDDING_MAX_DEPTH", 1):
+            in_memory, _ = app.estimate_peak_memory(package)
+            # The two packages under the limit can be in flight, input and output each
+            largest = len(big_docx)
+            self.assertEqual(in_memory, len(package.getvalue()) * 3 + largest * 2
+                             + (len(clean_workbook) + len(deep_workbook)) * 2)
+
+            for streaming in (False, True):
+                skipped = []
+                result = app.process_docx(package, ["Old Author"], "NewName", "NN",
+                                          streaming=streaming, skipped=skipped)
+                result = io.BytesIO(app._as_download_data(result))
+
+                self.assertEqual(sorted(skipped), [
+                    ('word/embeddings/big.docx', 'is larger than 1 MB'),
+                    ('word/embeddings/deep.xlsx/xl/embeddings/Nested.docx', 'is nested deeper than 1 levels'),
+                ])
+                # Unchanged and skipped packages are copied as they were compressed
+                for name in ('word/embeddings/clean.xlsx', 'word/embeddings/big.docx'):
+                    self.assertEqual(raw_member(result, name), raw_member(package, name))
+                with zipfile.ZipFile(result) as z:
+                    self.assertEqual(z.testzip(), None)
+                    self.assertEqual(z.read('word/document.xml'), b'<w:ins w:author="NewName"/>')
+                    deep = io.BytesIO(z.read('word/embeddings/deep.xlsx'))
+                self.assertEqual(zipfile.ZipFile(deep).read('xl/comments1.xml'), b'<authors><author>NewName</author></authors>')
+                # Inside a rewritten package, untouched members keep their compressed bytes too
+                for name in ('xl/media/image1.png', 'xl/embeddings/Nested.docx'):
+                    self.assertEqual(raw_member(deep, name), raw_member(io.BytesIO(deep_workbook), name))
+
+        print("Test passed: Embedding limits reported, unchanged packages copied raw.")
+
+
+    def test_configure_logging(self):
+        """Test that the app logger gets one handler at the configured level"""
+        self.addCleanup(setattr, app.logger, "handlers", list(app.logger.handlers))
+        self.addCleanup(setattr, app.logger, "propagate", app.logger.propagate)
+        app.logger.handlers = []
+        with patch.object(app, "LOG_LEVEL", "INFO"):
+            app.configure_logging()
+            app.configure_logging()
+        self.assertEqual(len(app.logger.handlers), 1)
+        self.assertTrue(app.logger.isEnabledFor(logging.INFO))
+        with self.assertLogs(app.logger, "INFO") as logs:
+            package = make_package({'word/document.xml': b'<w:p/>', 'word/media/image1.png': bytes(range(256)) * 2048})
+            app.check_memory_budget(package, budget_mb=0.5)
+        self.assertIn("downgrading to streaming path", logs.output[0])
+        print("Test passed: Logging configured")
+
+    def test_memory_budget(self):
+        """Test peak-memory estimates and the memory/stream/reject decision"""
+        document_xml = b'<w:document>' + b'<w:p/>' * 20000 + b'</w:document>'
+        media = bytes(range(256)) * 2048
+        package = make_package({'word/document.xml': document_xml, 'word/media/image1.png': media})
+        upload_size = len(package.getvalue())
+
+        in_memory, streaming = app.estimate_peak_memory(package)
+        self.assertEqual(in_memory, upload_size * 3 + len(media) * 2)
+        # Streaming ignores the media member but counts the output read back for the download
+        self.assertEqual(streaming, upload_size * 2 + len(document_xml) * 2)
+        self.assertEqual(package.tell(), 0)
+
+        mb = 1024 * 1024
+        self.assertEqual(app.check_memory_budget(package, budget_mb=0), "memory")
+        self.assertEqual(app.check_memory_budget(package, budget_mb=in_memory / mb), "memory")
+        self.assertEqual(app.check_memory_budget(package, budget_mb=streaming / mb), "stream")
+        self.assertEqual(app.check_memory_budget(package, budget_mb=(streaming - 1) / mb), "reject")
+        self.assertEqual(app.check_memory_budget(io.BytesIO(b'not a zip'), budget_mb=1), "memory")
+        print("Test passed: Memory budget")
+
+    def test_mmap_input(self):
+        """Test stored members read straight from an mmap-backed upload"""
+        document_xml = b'<w:document><w:ins w:author="Alice"><w:r><w:t>Hi</w:t></w:r></w:ins></w:document>'
+        members = {'word/document.xml': document_xml, 'word/media/image1.png': bytes(range(256))}
+
+        for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            package = make_package(members, compression)
+            source = app.spool_to_mmap(package)
+            self.assertEqual(package.tell(), 0)
+            with zipfile.ZipFile(source) as zin:
+                for item in zin.infolist():
+                    content = app.read_member(zin, item, source)
+                    self.assertEqual(bytes(content), members[item.filename])
+                    # Stored members are views into the mapping, compressed ones are inflated copies
+                    self.assertIsInstance(content, memoryview if compression == zipfile.ZIP_STORED else bytes)
+                    if isinstance(content, memoryview):
+                        content.release()
+            self.assertEqual(app.extract_revision_authors(source), ["Alice"])
+            source.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stored.docx')
+            with open(path, 'wb') as f:
+                f.write(make_package(members, zipfile.ZIP_STORED).getvalue())
+            source = app.map_path(path)
+            with zipfile.ZipFile(source) as zin:
+                self.assertEqual(bytes(app.read_member(zin, zin.getinfo('word/document.xml'), source)), document_xml)
+            source.close()
+
+            empty = os.path.join(directory, 'empty.docx')
+            open(empty, 'wb').close()
+            self.assertIsNone(app.map_path(empty))
+        print("Test passed: mmap input")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+import types
+import zipfile
+import unittest
+
+# corpus_report imports app.py, which imports streamlit (and pandas) at module level.
+# Minimal stand-ins are installed when the UI dependencies are not available.
+for _module in ("streamlit", "pandas"):
+    try:
+        __import__(_module)
+    except ImportError:
+        sys.modules[_module] = types.ModuleType(_module)
+
+import corpus_report
+
+
+def write_docx(path, document_xml, creator="Alice"):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('word/document.xml', document_xml)
+        z.writestr('docProps/core.xml', f'<cp:coreProperties><dc:creator>{creator}</dc:creator></cp:coreProperties>')
+
+
+class TestCorpusReport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.directory.name, 'corpus')
+        os.makedirs(self.root)
+        for i in range(6):
+            write_docx(
+                os.path.join(self.root, f'doc{i}.docx'),
+                f'<w:ins w:author="Alice"><w:t>{i}</w:t></w:ins><w:del w:author="Dave; Smith"><w:t>x</w:t></w:del>',
+                creator="Dave; Smith" if i % 2 else "Alice",
+            )
+        with open(os.path.join(self.root, 'broken.docx'), 'wb') as f:
+            f.write(b'not a zip')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def paths(self, fmt):
+        output = os.path.join(self.directory.name, f'report.{fmt}')
+        return output, output + '.checkpoint', output + '.summary.json'
+
+    def test_csv_round_trip(self):
+        """Test that names containing separators survive the CSV round trip"""
+        doc = {
+            "path": "a.docx", "revisions": {"Dave; Smith": {"insertions": 1, "deletions": 2}},
+            "comments": {"Dave; Smith": 3}, "creator": ["Dave; Smith"], "last_modified_by": ["a, b", "c"], "error": None,
+        }
+        rows = list(corpus_report.csv_rows(doc))
+        self.assertEqual(len(rows), 1)
+
+        output, _, _ = self.paths('csv')
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=corpus_report.CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        self.assertEqual(corpus_report.read_documents(output, 'csv'), {"a.docx": doc})
+        print("Test passed: CSV round trip")
+
+    def test_read_documents_skips_torn_lines(self):
+        """Test that a half-written JSONL line is skipped"""
+        output, _, _ = self.paths('jsonl')
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"path": "a.docx", "revisions": {}, "comments": {}, "creator": [],
+                                "last_modified_by": [], "error": None}) + "\n")
+            f.write('{"path": "b.docx", "revis')
+        self.assertEqual(list(corpus_report.read_documents(output, 'jsonl')), ["a.docx"])
+        print("Test passed: Torn JSONL line skipped")
+
+    def test_build_summary(self):
+        """Test per-author aggregation across documents"""
+        docs = {
+            "a.docx": {"path": "a.docx", "revisions": {"Alice": {"insertions": 2, "deletions": 1}},
+                       "comments": {"Bob": 1}, "creator": ["Alice"], "last_modified_by": ["Bob"], "error": None},
+            "b.docx": {"path": "b.docx", "revisions": {}, "comments": {}, "creator": [], "last_modified_by": [],
+                       "error": "not a valid docx or zip file"},
+        }
+        summary = corpus_report.build_summary(docs)
+        self.assertEqual(summary["documents"], 2)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["columns"], {
+            "author": ["Alice", "Bob"], "documents": [1, 1], "insertions": [2, 0], "deletions": [1, 0],
+            "comments": [0, 1], "creator_of": [1, 0], "last_modified_by_of": [0, 1],
+        })
+        print("Test passed: Summary")
+
+    def test_resume_after_torn_write(self):
+        """Test that a run interrupted mid-write resumes to the same summary"""
+        for fmt in ('jsonl', 'csv'):
+            output, checkpoint, summary_path = self.paths(fmt)
+            full = corpus_report.run(self.root, output, fmt, checkpoint, summary_path, workers=1)
+            self.assertEqual(full["documents"], 7)
+            self.assertEqual(full["errors"], 1)
+            dave = full["columns"]["author"].index("Dave; Smith")
+            self.assertEqual(full["columns"]["creator_of"][dave], 3)
+
+            # Simulate a crash: the last row is torn and its path never reached the checkpoint
+            with open(output, 'rb') as f:
+                data = f.read()
+            last_row = data.rstrip(b'\r\n').rsplit(b'\n', 1)[-1]
+            with open(output, 'wb') as f:
+                f.write(data[:data.rindex(last_row) + len(last_row) // 2])
+            with open(checkpoint, encoding='utf-8') as f:
+                done = f.read().splitlines()
+            torn_path = next(p for p in done if p.encode('utf-8') in last_row)
+            with open(checkpoint, 'w', encoding='utf-8') as f:
+                f.write("\n".join(p for p in done if p != torn_path) + "\n" + torn_path[:5])
+
+            resumed = corpus_report.run(self.root, output, fmt, checkpoint, summary_path, workers=1)
+            self.assertEqual(resumed, full)
+            self.assertEqual(len(corpus_report.load_checkpoint(checkpoint)), 7)
+        print("Test passed: Resume after torn write")
+
+if __name__ == '__main__':
+    unittest.main()